@@ -4,6 +4,8 @@ Document initialization and configuration for Year Planner.
 Handles document setup, page layout, and margins.
 """
 
+from functools import lru_cache
+
 from docx import Document
 from docx.shared import Cm, Pt, Twips
 from docx.enum.section import WD_ORIENT
@@ -12,6 +14,7 @@ from docx.enum.text import WD_LINE_SPACING
 from docx.section import Section
 from docx.oxml import parse_xml
 from docx.oxml.ns import qn
+from docx.text.paragraph import Paragraph
 
 from src.config import Config
 
@@ -696,6 +699,71 @@ def _build_config_info_text(config: Config) -> str:
     return '\n'.join(lines)
 
 
+# Minimal anchor paragraph: no spacing, exact 1pt (20 twip) line height
+_MINIMAL_P_XML = (
+    '<w:p xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+    '<w:pPr><w:spacing w:before="0" w:after="0" w:line="20" w:lineRule="exact"/></w:pPr>'
+    '</w:p>'
+)
+
+# Config info text box DrawingML, serialized once as bytes. Position, size,
+# drawing ID and paragraph content are substituted per page with bytes.replace.
+# Standard Word text box XML - same as Insert > Text Box
+# behindDoc="0" = in front of text
+# relativeFrom="page" = positioned relative to page edges
+_CONFIG_TEXTBOX_TEMPLATE = b'''<w:drawing xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+        xmlns:wp="http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing"
+        xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main"
+        xmlns:wps="http://schemas.microsoft.com/office/word/2010/wordprocessingShape"
+        xmlns:wp14="http://schemas.microsoft.com/office/word/2010/wordprocessingDrawing">
+      <wp:anchor distT="0" distB="0" distL="114300" distR="114300"
+                 simplePos="0" relativeHeight="251659264" behindDoc="0"
+                 locked="0" layoutInCell="1" allowOverlap="1">
+        <wp:simplePos x="0" y="0"/>
+        <wp:positionH relativeFrom="page"><wp:posOffset>__X__</wp:posOffset></wp:positionH>
+        <wp:positionV relativeFrom="page"><wp:posOffset>__Y__</wp:posOffset></wp:positionV>
+        <wp:extent cx="__CX__" cy="__CY__"/>
+        <wp:effectExtent l="0" t="0" r="0" b="0"/>
+        <wp:wrapNone/>
+        <wp:docPr id="__ID__" name="ConfigInfo___ID__"/>
+        <wp:cNvGraphicFramePr><a:graphicFrameLocks/></wp:cNvGraphicFramePr>
+        <a:graphic>
+          <a:graphicData uri="http://schemas.microsoft.com/office/word/2010/wordprocessingShape">
+            <wps:wsp>
+              <wps:cNvSpPr txBox="1"><a:spLocks noChangeArrowheads="1"/></wps:cNvSpPr>
+              <wps:spPr bwMode="auto">
+                <a:xfrm><a:off x="0" y="0"/><a:ext cx="__CX__" cy="__CY__"/></a:xfrm>
+                <a:prstGeom prst="rect"><a:avLst/></a:prstGeom>
+                <a:solidFill><a:srgbClr val="FFFFFF"/></a:solidFill>
+                <a:ln w="6350"><a:solidFill><a:srgbClr val="000000"/></a:solidFill><a:miter lim="800000"/><a:headEnd/><a:tailEnd/></a:ln>
+              </wps:spPr>
+              <wps:txbx><w:txbxContent>__CONTENT__</w:txbxContent></wps:txbx>
+              <wps:bodyPr rot="0" vert="horz" wrap="square" lIns="91440" tIns="45720" rIns="91440" bIns="45720" anchor="t" anchorCtr="0" upright="1"><a:spAutoFit/></wps:bodyPr>
+            </wps:wsp>
+          </a:graphicData>
+        </a:graphic>
+      </wp:anchor>
+    </w:drawing>'''
+
+
+def _append_minimal_paragraph(document: Document) -> Paragraph:
+    """
+    Append an empty paragraph with zero spacing and an exact 1pt line height.
+
+    Parsed from a fixed XML fragment rather than built with several
+    python-docx paragraph format calls.
+
+    Args:
+        document: The document to append the paragraph to.
+
+    Returns:
+        The new paragraph.
+    """
+    p = parse_xml(_MINIMAL_P_XML)
+    document.element.body._insert_p(p)
+    return Paragraph(p, document._body)
+
+
 def _add_config_textbox_to_body(
     document: Document,
     x_cm: float, y_cm: float,
@@ -732,12 +800,7 @@ def _add_config_textbox_to_body(
         run.font.size = Pt(1)
     else:
         # Create a new minimal paragraph to hold the text box
-        paragraph = document.add_paragraph()
-        paragraph.paragraph_format.space_before = Pt(0)
-        paragraph.paragraph_format.space_after = Pt(0)
-        paragraph.paragraph_format.line_spacing = Pt(1)
-        paragraph.paragraph_format.line_spacing_rule = WD_LINE_SPACING.EXACTLY
-
+        paragraph = _append_minimal_paragraph(document)
         run = paragraph.add_run()
         run.font.size = Pt(1)
 
@@ -789,42 +852,16 @@ def _add_config_textbox_to_body(
     lines = [title, ''] + content.split('\n')
     content_xml = ''.join(make_para(line, is_title=(i == 0)) for i, line in enumerate(lines))
 
-    # Standard Word text box XML - same as Insert > Text Box
-    # behindDoc="0" = in front of text
-    # relativeFrom="page" = positioned relative to page edges
-    textbox_xml = f'''<w:drawing xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"
-        xmlns:wp="http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing"
-        xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main"
-        xmlns:wps="http://schemas.microsoft.com/office/word/2010/wordprocessingShape"
-        xmlns:wp14="http://schemas.microsoft.com/office/word/2010/wordprocessingDrawing">
-      <wp:anchor distT="0" distB="0" distL="114300" distR="114300"
-                 simplePos="0" relativeHeight="251659264" behindDoc="0"
-                 locked="0" layoutInCell="1" allowOverlap="1">
-        <wp:simplePos x="0" y="0"/>
-        <wp:positionH relativeFrom="page"><wp:posOffset>{x_emu}</wp:posOffset></wp:positionH>
-        <wp:positionV relativeFrom="page"><wp:posOffset>{y_emu}</wp:posOffset></wp:positionV>
-        <wp:extent cx="{width_emu}" cy="{height_emu}"/>
-        <wp:effectExtent l="0" t="0" r="0" b="0"/>
-        <wp:wrapNone/>
-        <wp:docPr id="{doc_pr_id}" name="ConfigInfo_{doc_pr_id}"/>
-        <wp:cNvGraphicFramePr><a:graphicFrameLocks/></wp:cNvGraphicFramePr>
-        <a:graphic>
-          <a:graphicData uri="http://schemas.microsoft.com/office/word/2010/wordprocessingShape">
-            <wps:wsp>
-              <wps:cNvSpPr txBox="1"><a:spLocks noChangeArrowheads="1"/></wps:cNvSpPr>
-              <wps:spPr bwMode="auto">
-                <a:xfrm><a:off x="0" y="0"/><a:ext cx="{width_emu}" cy="{height_emu}"/></a:xfrm>
-                <a:prstGeom prst="rect"><a:avLst/></a:prstGeom>
-                <a:solidFill><a:srgbClr val="FFFFFF"/></a:solidFill>
-                <a:ln w="6350"><a:solidFill><a:srgbClr val="000000"/></a:solidFill><a:miter lim="800000"/><a:headEnd/><a:tailEnd/></a:ln>
-              </wps:spPr>
-              <wps:txbx><w:txbxContent>{content_xml}</w:txbxContent></wps:txbx>
-              <wps:bodyPr rot="0" vert="horz" wrap="square" lIns="91440" tIns="45720" rIns="91440" bIns="45720" anchor="t" anchorCtr="0" upright="1"><a:spAutoFit/></wps:bodyPr>
-            </wps:wsp>
-          </a:graphicData>
-        </a:graphic>
-      </wp:anchor>
-    </w:drawing>'''
+    # Fill the pre-serialized text box template
+    textbox_xml = (
+        _CONFIG_TEXTBOX_TEMPLATE
+        .replace(b'__X__', str(x_emu).encode())
+        .replace(b'__Y__', str(y_emu).encode())
+        .replace(b'__CX__', str(width_emu).encode())
+        .replace(b'__CY__', str(height_emu).encode())
+        .replace(b'__ID__', str(doc_pr_id).encode())
+        .replace(b'__CONTENT__', content_xml.encode('utf-8'))
+    )
 
     drawing = parse_xml(textbox_xml)
     run._r.append(drawing)
@@ -1156,10 +1193,14 @@ def get_header_row_height_twips(config: Config) -> int:
     return int(config.table.header_row.height * TWIPS_PER_PT)
 
 
+@lru_cache(maxsize=256)
 def grayscale_to_hex(grayscale: int) -> str:
     """
     Convert grayscale percentage to hex color string.
 
+    Memoized, since the same few config grayscale values are converted
+    for every table.
+
     Args:
         grayscale: Grayscale value (0=white, 100=black).
 
@@ -1170,10 +1211,13 @@ def grayscale_to_hex(grayscale: int) -> str:
     return f"{gray_value:02X}{gray_value:02X}{gray_value:02X}"
 
 
+@lru_cache(maxsize=256)
 def grayscale_to_rgb(grayscale: int) -> tuple[int, int, int]:
     """
     Convert grayscale percentage to RGB tuple.
 
+    Memoized like grayscale_to_hex; the returned tuple is immutable.
+
     Args:
         grayscale: Grayscale value (0=white, 100=black).
 
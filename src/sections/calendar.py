@@ -9,12 +9,17 @@ Generates two calendar pages:
 """
 
 import calendar as cal_module
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
 from docx import Document
-from docx.shared import Cm, Pt, RGBColor
+from docx.shared import Cm, Emu, Pt, RGBColor, Twips
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.enum.table import WD_TABLE_ALIGNMENT
 from docx.oxml import parse_xml
 from docx.oxml.ns import qn
+from lxml.etree import SubElement
 
 from src.config import Config
 from src.document import (
@@ -28,6 +33,100 @@ from src.utils.styles import FONT_NAME, COLOR_BLACK
 from src.utils.tables import set_table_borders
 
 
+# Namespace-resolved tag names, resolved once at import instead of per call
+_QN_TRHEIGHT = qn('w:trHeight')
+_QN_VALIGN = qn('w:vAlign')
+_QN_TCW = qn('w:tcW')
+_QN_SHD = qn('w:shd')
+_QN_TBLLAYOUT = qn('w:tblLayout')
+_QN_TBLGRID = qn('w:tblGrid')
+_QN_P = qn('w:p')
+
+# Mini calendar font sizes in points
+MONTH_NAME_FONT_SIZE_PT = 10
+DAY_FONT_SIZE_PT = 7
+
+# Free-threaded (PEP 703) interpreters can build month calendars in parallel
+_FREE_THREADED = not getattr(sys, '_is_gil_enabled', lambda: True)()
+
+
+def _rpr_xml(font_size_pt: float, bold: bool) -> str:
+    """
+    Build the run-properties XML for mini calendar text.
+
+    Args:
+        font_size_pt: Font size in points.
+        bold: Whether the text is bold.
+
+    Returns:
+        Serialized ``w:rPr`` element (without namespace declaration).
+    """
+    bold_tag = '<w:b/>' if bold else ''
+    return (
+        f'<w:rPr><w:rFonts w:ascii="{FONT_NAME}" w:hAnsi="{FONT_NAME}"/>{bold_tag}'
+        f'<w:color w:val="{COLOR_BLACK}"/>'
+        f'<w:sz w:val="{int(font_size_pt * 2)}"/>'  # Half-points
+        f'</w:rPr>'
+    )
+
+
+# Run-property fragments, built once and shared by every mini calendar run
+# instead of setting font name/size/bold/color through python-docx per run
+_RPR_MONTH_NAME = _rpr_xml(MONTH_NAME_FONT_SIZE_PT, bold=True)
+_RPR_DAY_HEADER = _rpr_xml(DAY_FONT_SIZE_PT, bold=True)
+_RPR_DAY = _rpr_xml(DAY_FONT_SIZE_PT, bold=False)
+
+# Day-of-month label strings (index 0 unused)
+_DAY_STR = tuple(str(day) for day in range(32))
+
+
+@dataclass(frozen=True, slots=True)
+class _CalendarStyle:
+    """Year-independent calendar grid styling, computed once per section."""
+    title_row_height_twips: int
+    month_row_height_twips: int
+    title_bg_hex: str
+    title_font_color: RGBColor
+    title_font_size: Pt
+    header_bg_hex: str
+
+
+def _build_calendar_style(config: Config) -> _CalendarStyle:
+    """
+    Compute the calendar grid styling shared by both year pages.
+
+    Args:
+        config: Configuration settings.
+
+    Returns:
+        Calendar style with row heights and title/header colors resolved.
+    """
+    # Get title row height from config
+    title_row_height_twips = get_title_row_height_twips(config)
+
+    # Calculate month row height dynamically to fill the page
+    # Formula: available = content_height - title_row - safety_margin - border_overhead
+    # Then: month_row_height = available / 6 (for 6 month rows)
+    #
+    # Table borders add overhead: 0.5pt borders at top/bottom = ~20 twips
+    # Plus additional safety for Word's implicit table spacing
+    TABLE_BORDER_OVERHEAD_TWIPS = 80  # Extra margin for table borders and spacing
+    available_twips = get_content_height_twips(config)
+    fixed_overhead = SAFETY_MARGIN_TWIPS + TABLE_BORDER_OVERHEAD_TWIPS + title_row_height_twips
+    remaining_twips = available_twips - fixed_overhead
+    month_row_height_twips = int(remaining_twips / 6)
+
+    # Title row styling from config; header row background for month names
+    return _CalendarStyle(
+        title_row_height_twips=title_row_height_twips,
+        month_row_height_twips=month_row_height_twips,
+        title_bg_hex=grayscale_to_hex(config.table.title_row.background_grayscale),
+        title_font_color=RGBColor(*grayscale_to_rgb(config.table.title_row.font_grayscale)),
+        title_font_size=Pt(config.table.title_row.font_size),
+        header_bg_hex=grayscale_to_hex(config.table.header_row.background_grayscale)
+    )
+
+
 def generate_calendar_section(document: Document, config: Config) -> None:
     """
     Generate the calendar section with current year and next year calendars.
@@ -55,9 +154,12 @@ def generate_calendar_section(document: Document, config: Config) -> None:
 
     content_width = get_content_width(config)
 
+    # Styling is the same for both years, so resolve it once
+    style = _build_calendar_style(config)
+
     # === Page 1 (recto): Current year calendar ===
     _generate_year_calendar_page(document, current_year, content_width,
-                                  day_row_height_pt, month_name_gap_pt, config)
+                                  day_row_height_pt, month_name_gap_pt, style, config)
     # Add overlay BEFORE page break so it's definitely on the calendar page
     add_config_info_overlay(document, config, is_recto=True)
     # Page break to move to Page 2 (blank verso)
@@ -71,7 +173,7 @@ def generate_calendar_section(document: Document, config: Config) -> None:
 
     # === Page 3 (recto): Next year calendar ===
     _generate_year_calendar_page(document, next_year, content_width,
-                                  day_row_height_pt, month_name_gap_pt, config)
+                                  day_row_height_pt, month_name_gap_pt, style, config)
     # Add overlay BEFORE page break so it's definitely on the calendar page
     add_config_info_overlay(document, config, is_recto=True)
     # Page break to move to Page 4 (blank verso)
@@ -86,7 +188,7 @@ def generate_calendar_section(document: Document, config: Config) -> None:
 def _generate_year_calendar_page(document: Document, year: int,
                                   content_width: float,
                                   day_row_height_pt: int, month_name_gap_pt: int,
-                                  config: Config) -> None:
+                                  style: _CalendarStyle, config: Config) -> None:
     """
     Generate a single year calendar page with dynamically computed height.
 
@@ -99,32 +201,29 @@ def _generate_year_calendar_page(document: Document, year: int,
         content_width: Available width in centimeters.
         day_row_height_pt: Height of day rows in points.
         month_name_gap_pt: Space between month name and days grid in points.
+        style: Precomputed calendar styling.
         config: Configuration settings.
     """
-    # Calculate available height dynamically (no preceding paragraph for first table)
-    # Calendar table has 1 title row + 6 month rows
-    title_row_height_twips = get_title_row_height_twips(config)
-
     # Validate table height - this will warn if the table won't fit
     # Using 0 for header_row_height since calendar doesn't have a header row
     validate_table_height(
         config,
         section_name=f"Calendar {year}",
         num_content_rows=6,  # 6 month rows
-        title_row_height_twips=title_row_height_twips,
+        title_row_height_twips=style.title_row_height_twips,
         header_row_height_twips=0,  # No header row in calendar
         preceding_paragraph_height_twips=0  # First element on page
     )
 
     # Create 2x6 grid of month calendars with title row
     _create_year_calendar_grid(document, year, content_width,
-                               day_row_height_pt, month_name_gap_pt, config)
+                               day_row_height_pt, month_name_gap_pt, style, config)
 
 
 def _create_year_calendar_grid(document: Document, year: int,
                                 content_width: float,
                                 day_row_height_pt: int, month_name_gap_pt: int,
-                                config: Config) -> None:
+                                style: _CalendarStyle, config: Config) -> None:
     """
     Create a 2x6 grid showing all 12 months of a year with a title row.
 
@@ -145,6 +244,7 @@ def _create_year_calendar_grid(document: Document, year: int,
         content_width: Available width in centimeters.
         day_row_height_pt: Height of day rows in points.
         month_name_gap_pt: Space between month name and days grid in points.
+        style: Precomputed calendar styling.
         config: Configuration settings.
     """
     # Create outer table (1 title row + 6 month rows x 2 columns)
@@ -166,45 +266,24 @@ def _create_year_calendar_grid(document: Document, year: int,
     # Set explicit table grid column widths
     _set_table_grid(outer_table, [cell_width_twips, cell_width_twips])
 
-    # Get title row height from config
-    title_row_height_twips = get_title_row_height_twips(config)
-
-    # Calculate month row height dynamically to fill the page
-    # Formula: available = content_height - title_row - safety_margin - border_overhead
-    # Then: month_row_height = available / 6 (for 6 month rows)
-    #
-    # Table borders add overhead: 0.5pt borders at top/bottom = ~20 twips
-    # Plus additional safety for Word's implicit table spacing
-    TABLE_BORDER_OVERHEAD_TWIPS = 80  # Extra margin for table borders and spacing
-    available_twips = get_content_height_twips(config)
-    fixed_overhead = SAFETY_MARGIN_TWIPS + TABLE_BORDER_OVERHEAD_TWIPS + title_row_height_twips
-    remaining_twips = available_twips - fixed_overhead
-    month_row_height_twips = int(remaining_twips / 6)
-
-    # Get title row styling from config
-    title_bg_hex = grayscale_to_hex(config.table.title_row.background_grayscale)
-    title_font_rgb = grayscale_to_rgb(config.table.title_row.font_grayscale)
-    title_font_color = RGBColor(*title_font_rgb)
-    title_font_size = Pt(config.table.title_row.font_size)
-
-    # Get header row background for month name shading
-    header_bg_hex = grayscale_to_hex(config.table.header_row.background_grayscale)
-
     # === TITLE ROW ===
     title_row = outer_table.rows[0]
-    _set_row_height(title_row, title_row_height_twips)
+    _set_row_height(title_row, style.title_row_height_twips)
 
-    # Merge cells for title row
+    # Span the first title cell across both columns (gridSpan) and drop the
+    # cell it covers, rather than going through _Cell.merge
+    title_tc, covered_tc = title_row._tr.tc_lst
+    title_row._tr.remove(covered_tc)
+    title_tc.grid_span = 2
     title_cell = title_row.cells[0]
-    title_cell.merge(title_row.cells[1])
 
     # Set merged cell width to full table width
     _set_cell_width(title_cell, content_width_twips)
 
     # Style title cell using config values
-    _set_cell_shading(title_cell, title_bg_hex)
+    _set_cell_shading(title_cell, style.title_bg_hex)
     _set_cell_vertical_alignment(title_cell, "center")
-    _add_title_text(title_cell, str(year), title_font_size, title_font_color)
+    _add_title_text(title_cell, str(year), style.title_font_size, style.title_font_color)
 
     # === MONTH ROWS ===
     months = [
@@ -216,20 +295,33 @@ def _create_year_calendar_grid(document: Document, year: int,
         ["November", "December"]
     ]
 
+    # Build the 12 month calendars as standalone XML first. Each one is
+    # independent of the document, so on free-threaded Python they are built
+    # in parallel; they are then stitched into the outer table serially.
+    month_args = [
+        (year, row_idx * 2 + col_idx + 1, month_name, cell_width_twips,
+         day_row_height_pt, month_name_gap_pt, style.header_bg_hex)
+        for row_idx, month_row in enumerate(months)
+        for col_idx, month_name in enumerate(month_row)
+    ]
+    if _FREE_THREADED:
+        with ThreadPoolExecutor() as executor:
+            month_xml = list(executor.map(
+                lambda args: _build_month_calendar_xml(*args), month_args
+            ))
+    else:
+        month_xml = [_build_month_calendar_xml(*args) for args in month_args]
+
     for row_idx, month_row in enumerate(months):
         row = outer_table.rows[row_idx + 1]  # +1 to skip title row
 
         # Set explicit row height to fill available space
-        _set_row_height(row, month_row_height_twips)
+        _set_row_height(row, style.month_row_height_twips)
 
         for col_idx, month_name in enumerate(month_row):
             cell = row.cells[col_idx]
             _set_cell_width(cell, cell_width_twips)
-
-            month_num = row_idx * 2 + col_idx + 1
-            _add_month_calendar(cell, year, month_num, month_name,
-                               day_row_height_pt, month_name_gap_pt,
-                               header_bg_hex)
+            _insert_month_calendar(cell, month_xml[row_idx * 2 + col_idx])
 
     # Add borders around each cell
     set_table_borders(outer_table, config.table)
@@ -247,16 +339,12 @@ def _set_row_height(row, height_twips: int) -> None:
     tr_pr = tr.get_or_add_trPr()
 
     # Remove existing height if any
-    existing_height = tr_pr.find(qn('w:trHeight'))
+    existing_height = tr_pr.find(_QN_TRHEIGHT)
     if existing_height is not None:
         tr_pr.remove(existing_height)
 
     # Set exact row height
-    tr_height = parse_xml(
-        f'<w:trHeight xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" '
-        f'w:val="{height_twips}" w:hRule="exact"/>'
-    )
-    tr_pr.append(tr_height)
+    SubElement(tr_pr, _QN_TRHEIGHT, {qn('w:hRule'): 'exact', qn('w:val'): str(height_twips)})
 
 
 def _set_cell_shading(cell, color_hex: str) -> None:
@@ -269,11 +357,8 @@ def _set_cell_shading(cell, color_hex: str) -> None:
     """
     tc = cell._tc
     tc_pr = tc.get_or_add_tcPr()
-    shd = parse_xml(
-        f'<w:shd xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" '
-        f'w:val="clear" w:color="auto" w:fill="{color_hex}"/>'
-    )
-    tc_pr.append(shd)
+    SubElement(tc_pr, _QN_SHD,
+               {qn('w:val'): 'clear', qn('w:color'): 'auto', qn('w:fill'): color_hex})
 
 
 def _set_cell_vertical_alignment(cell, alignment: str) -> None:
@@ -288,15 +373,11 @@ def _set_cell_vertical_alignment(cell, alignment: str) -> None:
     tc_pr = tc.get_or_add_tcPr()
 
     # Remove existing vAlign if any
-    existing_valign = tc_pr.find(qn('w:vAlign'))
+    existing_valign = tc_pr.find(_QN_VALIGN)
     if existing_valign is not None:
         tc_pr.remove(existing_valign)
 
-    v_align = parse_xml(
-        f'<w:vAlign xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" '
-        f'w:val="{alignment}"/>'
-    )
-    tc_pr.append(v_align)
+    SubElement(tc_pr, _QN_VALIGN, {qn('w:val'): alignment})
 
 
 def _add_title_text(cell, text: str, font_size, font_color) -> None:
@@ -333,138 +414,105 @@ def _set_cell_margins(cell, top: int = 0, bottom: int = 0,
     tc = cell._tc
     tc_pr = tc.get_or_add_tcPr()
 
-    tc_mar = parse_xml(
-        f'''<w:tcMar xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">
-            <w:top w:w="{top}" w:type="dxa"/>
-            <w:bottom w:w="{bottom}" w:type="dxa"/>
-            <w:left w:w="{left}" w:type="dxa"/>
-            <w:right w:w="{right}" w:type="dxa"/>
-        </w:tcMar>'''
-    )
-    tc_pr.append(tc_mar)
+    tc_mar = SubElement(tc_pr, qn('w:tcMar'))
+    for edge, width in (('top', top), ('bottom', bottom), ('left', left), ('right', right)):
+        SubElement(tc_mar, qn(f'w:{edge}'), {qn('w:w'): str(width), qn('w:type'): 'dxa'})
 
 
-def _add_month_calendar(cell, year: int, month: int, month_name: str,
-                        day_row_height_pt: int, month_name_gap_pt: int,
-                        header_bg_hex: str = None) -> None:
+def _build_month_calendar_xml(year: int, month: int, month_name: str,
+                              cell_width_twips: int,
+                              day_row_height_pt: int, month_name_gap_pt: int,
+                              header_bg_hex: str = None) -> str:
     """
-    Add a mini calendar for a single month to a table cell.
+    Build the XML for a single month's mini calendar.
+
+    Pure function of its arguments (does not touch the document), so it is
+    safe to call from worker threads.
 
     Args:
-        cell: The table cell to add the calendar to.
         year: The year.
         month: The month number (1-12).
         month_name: The name of the month.
+        cell_width_twips: Width of the enclosing cell in twips.
         day_row_height_pt: Height of day rows in points.
         month_name_gap_pt: Space between month name and days grid in points.
         header_bg_hex: Background color for month name (hex string, e.g., "BFBFBF").
-    """
-    # Clear existing paragraph
-    cell.paragraphs[0].clear()
 
-    # Add month name as header
-    header_para = cell.paragraphs[0]
-    header_run = header_para.add_run(month_name)
-    header_run.font.name = FONT_NAME
-    header_run.font.size = Pt(10)
-    header_run.font.bold = True
-    header_run.font.color.rgb = COLOR_BLACK
-    header_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    header_para.paragraph_format.space_after = Pt(month_name_gap_pt)
-
-    # Add background shading to month name paragraph
-    if header_bg_hex:
-        _set_paragraph_shading(header_para, header_bg_hex)
+    Returns:
+        Serialized ``w:tc`` wrapper holding the month name paragraph, the
+        borderless days table, and the trailing paragraph Word requires.
+    """
+    # Month name header (centered, shaded, gap below)
+    gap_twips = int(month_name_gap_pt * TWIPS_PER_PT)
+    shading = (f'<w:shd w:val="clear" w:color="auto" w:fill="{header_bg_hex}"/>'
+               if header_bg_hex else '')
+    header_xml = (
+        f'<w:p><w:pPr><w:spacing w:after="{gap_twips}"/><w:jc w:val="center"/>{shading}</w:pPr>'
+        f'<w:r>{_RPR_MONTH_NAME}<w:t>{month_name}</w:t></w:r></w:p>'
+    )
 
     # Get calendar data for the month
     cal = cal_module.Calendar(firstweekday=6)  # Sunday first
     month_days = cal.monthdayscalendar(year, month)
 
-    # Create mini table for days (header + weeks)
-    num_weeks = len(month_days)
-    mini_table = cell.add_table(rows=num_weeks + 1, cols=7)
-    mini_table.alignment = WD_TABLE_ALIGNMENT.CENTER
-    mini_table.autofit = True
-
     # Row height for day rows (configurable vertical spacing)
-    day_row_height = Pt(day_row_height_pt)
+    day_row_height_twips = round(day_row_height_pt * TWIPS_PER_PT)
+    # Split the cell width in EMU and round back to twips, as add_table did
+    col_width_twips = Emu(Twips(cell_width_twips) // 7).twips
+
+    row_open = f'<w:tr><w:trPr><w:trHeight w:val="{day_row_height_twips}"/></w:trPr>'
+    cell_open = (f'<w:tc><w:tcPr><w:tcW w:w="{col_width_twips}" w:type="dxa"/></w:tcPr>'
+                 f'<w:p><w:pPr><w:jc w:val="center"/></w:pPr>')
+    cell_close = '</w:p></w:tc>'
 
     # Day headers (S M T W T F S)
     day_headers = ["S", "M", "T", "W", "T", "F", "S"]
-    header_row = mini_table.rows[0]
-    header_row.height = day_row_height
-    for i, day_header in enumerate(day_headers):
-        header_cell = header_row.cells[i]
-        para = header_cell.paragraphs[0]
-        run = para.add_run(day_header)
-        run.font.name = FONT_NAME
-        run.font.size = Pt(7)
-        run.font.bold = True
-        run.font.color.rgb = COLOR_BLACK
-        para.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    rows_xml = [row_open]
+    for day_header in day_headers:
+        rows_xml.append(f'{cell_open}<w:r>{_RPR_DAY_HEADER}<w:t>{day_header}</w:t></w:r>{cell_close}')
+    rows_xml.append('</w:tr>')
 
     # Fill in the days
-    for week_idx, week in enumerate(month_days):
-        week_row = mini_table.rows[week_idx + 1]
-        week_row.height = day_row_height
-        for day_idx, day in enumerate(week):
-            day_cell = week_row.cells[day_idx]
-            para = day_cell.paragraphs[0]
+    for week in month_days:
+        rows_xml.append(row_open)
+        for day in week:
             if day != 0:
-                run = para.add_run(str(day))
-                run.font.name = FONT_NAME
-                run.font.size = Pt(7)
-                run.font.color.rgb = COLOR_BLACK
-            para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-
-    # Remove borders from mini table
-    _remove_table_borders(mini_table)
-
-
-def _set_paragraph_shading(paragraph, color_hex: str) -> None:
-    """
-    Set background shading for a paragraph.
-
-    Args:
-        paragraph: The paragraph to shade.
-        color_hex: Hex color string (e.g., "BFBFBF" for gray).
-    """
-    p = paragraph._p
-    p_pr = p.get_or_add_pPr()
+                rows_xml.append(f'{cell_open}<w:r>{_RPR_DAY}<w:t>{_DAY_STR[day]}</w:t></w:r>{cell_close}')
+            else:
+                rows_xml.append(f'{cell_open}{cell_close}')
+        rows_xml.append('</w:tr>')
+
+    # Mini table: centered, autofit, no borders
+    grid_xml = f'<w:gridCol w:w="{col_width_twips}"/>' * 7
+    table_xml = (
+        '<w:tbl><w:tblPr><w:tblW w:w="0" w:type="auto"/><w:jc w:val="center"/>'
+        '<w:tblLayout w:type="autofit"/>'
+        '<w:tblLook w:val="04A0" w:firstRow="1" w:lastRow="0" w:firstColumn="1" '
+        'w:lastColumn="0" w:noHBand="0" w:noVBand="1"/>'
+        '<w:tblBorders><w:top w:val="nil"/><w:left w:val="nil"/><w:bottom w:val="nil"/>'
+        '<w:right w:val="nil"/><w:insideH w:val="nil"/><w:insideV w:val="nil"/></w:tblBorders>'
+        f'</w:tblPr><w:tblGrid>{grid_xml}</w:tblGrid>{"".join(rows_xml)}</w:tbl>'
+    )
 
-    shd = parse_xml(
-        f'<w:shd xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" '
-        f'w:val="clear" w:color="auto" w:fill="{color_hex}"/>'
+    return (
+        f'<w:tc xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+        f'{header_xml}{table_xml}<w:p/></w:tc>'
     )
-    p_pr.append(shd)
 
 
-def _remove_table_borders(table) -> None:
+def _insert_month_calendar(cell, month_xml: str) -> None:
     """
-    Remove all borders from a table.
+    Replace a cell's placeholder paragraph with a prebuilt month calendar.
 
     Args:
-        table: The table to remove borders from.
+        cell: The table cell to fill.
+        month_xml: Output of ``_build_month_calendar_xml()``.
     """
-    tbl = table._tbl
-    tbl_pr = tbl.tblPr if tbl.tblPr is not None else parse_xml(
-        r'<w:tblPr xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"/>'
-    )
-
-    tbl_borders = parse_xml(
-        '''<w:tblBorders xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">
-            <w:top w:val="nil"/>
-            <w:left w:val="nil"/>
-            <w:bottom w:val="nil"/>
-            <w:right w:val="nil"/>
-            <w:insideH w:val="nil"/>
-            <w:insideV w:val="nil"/>
-        </w:tblBorders>'''
-    )
-
-    tbl_pr.append(tbl_borders)
-    if tbl.tblPr is None:
-        tbl.insert(0, tbl_pr)
+    # Drop the placeholder paragraph directly rather than through
+    # cell.paragraphs, which wraps every child paragraph in a Paragraph
+    tc = cell._tc
+    tc.remove(tc.find(_QN_P))
+    tc.extend(list(parse_xml(month_xml)))
 
 
 def _set_table_layout_fixed(table) -> None:
@@ -474,19 +522,7 @@ def _set_table_layout_fixed(table) -> None:
     Args:
         table: The table to set layout on.
     """
-    tbl = table._tbl
-    tbl_pr = tbl.tblPr
-    if tbl_pr is None:
-        tbl_pr = parse_xml(
-            r'<w:tblPr xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"/>'
-        )
-        tbl.insert(0, tbl_pr)
-
-    tbl_layout = parse_xml(
-        '<w:tblLayout xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" '
-        'w:type="fixed"/>'
-    )
-    tbl_pr.append(tbl_layout)
+    SubElement(table._tbl.tblPr, _QN_TBLLAYOUT, {qn('w:type'): 'fixed'})
 
 
 def _set_table_cell_margins(table, top: int = None, bottom: int = None,
@@ -501,13 +537,7 @@ def _set_table_cell_margins(table, top: int = None, bottom: int = None,
         left: Left margin in twips (None to keep default).
         right: Right margin in twips (None to keep default).
     """
-    tbl = table._tbl
-    tbl_pr = tbl.tblPr
-    if tbl_pr is None:
-        tbl_pr = parse_xml(
-            r'<w:tblPr xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"/>'
-        )
-        tbl.insert(0, tbl_pr)
+    tbl_pr = table._tbl.tblPr
 
     # Build tblCellMar element with only specified margins
     margin_elements = []
@@ -540,24 +570,17 @@ def _set_table_grid(table, col_widths: list[int]) -> None:
     tbl = table._tbl
 
     # Remove existing grid if any
-    existing_grid = tbl.find(qn('w:tblGrid'))
+    existing_grid = tbl.find(_QN_TBLGRID)
     if existing_grid is not None:
         tbl.remove(existing_grid)
 
-    # Create new grid
-    grid_xml = '<w:tblGrid xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+    # Create new grid directly as elements
+    tbl_grid = tbl.makeelement(_QN_TBLGRID, {})
     for width in col_widths:
-        grid_xml += f'<w:gridCol w:w="{width}"/>'
-    grid_xml += '</w:tblGrid>'
+        SubElement(tbl_grid, qn('w:gridCol'), {qn('w:w'): str(width)})
 
-    tbl_grid = parse_xml(grid_xml)
-
-    # Insert after tblPr
-    tbl_pr = tbl.tblPr
-    if tbl_pr is not None:
-        tbl_pr.addnext(tbl_grid)
-    else:
-        tbl.insert(0, tbl_grid)
+    # Insert after tblPr (python-docx creates it together with the table)
+    tbl.tblPr.addnext(tbl_grid)
 
 
 def _set_cell_width(cell, width_twips: int) -> None:
@@ -572,12 +595,9 @@ def _set_cell_width(cell, width_twips: int) -> None:
     tc_pr = tc.get_or_add_tcPr()
 
     # Remove existing width if any
-    existing_width = tc_pr.find(qn('w:tcW'))
+    existing_width = tc_pr.find(_QN_TCW)
     if existing_width is not None:
         tc_pr.remove(existing_width)
 
-    tc_w = parse_xml(
-        f'<w:tcW xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" '
-        f'w:w="{width_twips}" w:type="dxa"/>'
-    )
+    tc_w = tc_pr.makeelement(_QN_TCW, {qn('w:type'): 'dxa', qn('w:w'): str(width_twips)})
     tc_pr.insert(0, tc_w)
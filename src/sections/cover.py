@@ -5,20 +5,23 @@ Generates the front cover (title, version, year) and inside cover
 (contact information table).
 """
 
+from xml.sax.saxutils import escape
+
 from docx import Document
-from docx.shared import Cm, Pt
+from docx.shared import Pt
 from docx.enum.text import WD_ALIGN_PARAGRAPH
-from docx.enum.table import WD_TABLE_ALIGNMENT
 
 from src.config import Config
-from src.document import get_content_width, get_content_height, add_page_break, add_config_info_overlay
+from src.document import (
+    get_content_width, get_content_height, add_page_break, add_config_info_overlay,
+    grayscale_to_hex, TWIPS_PER_CM
+)
 from src.utils.styles import (
     FONT_NAME, FONT_SIZE_TITLE, FONT_SIZE_SUBTITLE, FONT_SIZE_NORMAL,
     COLOR_BLACK
 )
 from src.utils.tables import (
-    create_table, set_table_borders, remove_table_borders,
-    set_cell_vertical_alignment, set_cell_shading
+    create_table, set_table_borders, remove_table_borders, append_table_xml
 )
 
 
@@ -117,40 +120,46 @@ def _generate_inside_cover(document: Document, config: Config) -> None:
     # Create contact information table
     contact_fields = config.cover.contact_fields
     table_config = config.cover.contact_table
-    num_rows = len(contact_fields)
 
-    table = document.add_table(rows=num_rows, cols=2)
-    table.alignment = WD_TABLE_ALIGNMENT.CENTER
-    table.autofit = False
-
-    # Set column widths from config (in cm)
-    label_width = Cm(table_config.label_width)
-    value_width = Cm(table_config.value_width)
-    row_height = Cm(table_config.row_height)
+    # Column widths and row height from config (cm -> twips)
+    label_w_twips = round(table_config.label_width * TWIPS_PER_CM)
+    value_w_twips = round(table_config.value_width * TWIPS_PER_CM)
+    row_h_twips = round(table_config.row_height * TWIPS_PER_CM)
 
     # Get label cell shading from contact_table config
     label_bg_grayscale = config.raw.get('cover', {}).get('contact_table', {}).get('label_grayscale', 5)
-
-    for i, field in enumerate(contact_fields):
-        row = table.rows[i]
-        row.height = row_height
-
-        # Label cell (right-aligned, vertically centered, shaded)
-        label_cell = row.cells[0]
-        label_cell.width = label_width
-        set_cell_vertical_alignment(label_cell, "center")
-        set_cell_shading(label_cell, label_bg_grayscale)
-        label_para = label_cell.paragraphs[0]
-        label_para.alignment = WD_ALIGN_PARAGRAPH.RIGHT
-        label_run = label_para.add_run(field)
-        label_run.font.name = FONT_NAME
-        label_run.font.bold = True
-        label_run.font.color.rgb = COLOR_BLACK
-
-        # Value cell (empty, vertically centered)
-        value_cell = row.cells[1]
-        value_cell.width = value_width
-        set_cell_vertical_alignment(value_cell, "center")
+    label_bg_hex = grayscale_to_hex(label_bg_grayscale)
+
+    # Build the whole table as one XML fragment and parse it once, rather
+    # than styling each cell through python-docx (~10 round trips per row)
+    rows_xml = []
+    for field in contact_fields:
+        # Label cell (right-aligned, vertically centered, shaded) and
+        # value cell (empty, vertically centered)
+        rows_xml.append(
+            f'<w:tr><w:trPr><w:trHeight w:val="{row_h_twips}"/></w:trPr>'
+            f'<w:tc><w:tcPr><w:tcW w:w="{label_w_twips}" w:type="dxa"/>'
+            f'<w:vAlign w:val="center"/>'
+            f'<w:shd w:val="clear" w:color="auto" w:fill="{label_bg_hex}"/></w:tcPr>'
+            f'<w:p><w:pPr><w:jc w:val="right"/></w:pPr>'
+            f'<w:r><w:rPr><w:rFonts w:ascii="{FONT_NAME}" w:hAnsi="{FONT_NAME}"/>'
+            f'<w:b/><w:color w:val="{COLOR_BLACK}"/></w:rPr>'
+            f'<w:t>{escape(field)}</w:t></w:r></w:p></w:tc>'
+            f'<w:tc><w:tcPr><w:tcW w:w="{value_w_twips}" w:type="dxa"/>'
+            f'<w:vAlign w:val="center"/></w:tcPr><w:p/></w:tc></w:tr>'
+        )
+
+    table = append_table_xml(
+        document,
+        f'<w:tbl xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+        f'<w:tblPr><w:tblW w:w="0" w:type="auto"/><w:jc w:val="center"/>'
+        f'<w:tblLayout w:type="fixed"/>'
+        f'<w:tblLook w:val="04A0" w:firstRow="1" w:lastRow="0" w:firstColumn="1" '
+        f'w:lastColumn="0" w:noHBand="0" w:noVBand="1"/></w:tblPr>'
+        f'<w:tblGrid><w:gridCol w:w="{label_w_twips}"/><w:gridCol w:w="{value_w_twips}"/></w:tblGrid>'
+        f'{"".join(rows_xml)}'
+        f'</w:tbl>'
+    )
 
     # Apply table borders
     set_table_borders(table, config.table)
@@ -9,6 +9,7 @@ from docx.shared import Pt, RGBColor
 from docx.enum.table import WD_TABLE_ALIGNMENT
 from docx.oxml.ns import qn
 from docx.oxml import parse_xml
+from lxml.etree import SubElement
 
 from src.config import Config
 from src.document import (
@@ -105,10 +106,13 @@ def _create_goals_table(document: Document, config: Config,
     title_row = table.rows[0]
     _set_row_height(title_row, title_row_height_twips)
 
-    # Merge all cells in title row
+    # Span the first title cell across all columns (gridSpan) and drop the
+    # cells it covers, rather than merging cell by cell with _Cell.merge
+    title_tcs = title_row._tr.tc_lst
+    for tc in title_tcs[1:]:
+        title_row._tr.remove(tc)
+    title_tcs[0].grid_span = num_columns
     title_cell = title_row.cells[0]
-    for i in range(1, num_columns):
-        title_cell.merge(title_row.cells[i])
 
     # Set title cell width
     _set_cell_width(title_cell, total_width_twips)
@@ -142,19 +146,9 @@ def _set_table_layout_fixed(table) -> None:
     Args:
         table: The table to set layout on.
     """
-    tbl = table._tbl
-    tbl_pr = tbl.tblPr
-    if tbl_pr is None:
-        tbl_pr = parse_xml(
-            r'<w:tblPr xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"/>'
-        )
-        tbl.insert(0, tbl_pr)
-
-    tbl_layout = parse_xml(
-        '<w:tblLayout xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" '
-        'w:type="fixed"/>'
-    )
-    tbl_pr.append(tbl_layout)
+    tbl_pr = table._tbl.tblPr
+
+    SubElement(tbl_pr, qn('w:tblLayout'), {qn('w:type'): 'fixed'})
 
 
 def _set_table_grid(table, col_widths: list[int]) -> None:
@@ -172,20 +166,13 @@ def _set_table_grid(table, col_widths: list[int]) -> None:
     if existing_grid is not None:
         tbl.remove(existing_grid)
 
-    # Create new grid
-    grid_xml = '<w:tblGrid xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+    # Create new grid directly as elements
+    tbl_grid = tbl.makeelement(qn('w:tblGrid'), {})
     for width in col_widths:
-        grid_xml += f'<w:gridCol w:w="{width}"/>'
-    grid_xml += '</w:tblGrid>'
+        SubElement(tbl_grid, qn('w:gridCol'), {qn('w:w'): str(width)})
 
-    tbl_grid = parse_xml(grid_xml)
-
-    # Insert after tblPr
-    tbl_pr = tbl.tblPr
-    if tbl_pr is not None:
-        tbl_pr.addnext(tbl_grid)
-    else:
-        tbl.insert(0, tbl_grid)
+    # Insert after tblPr (python-docx creates it together with the table)
+    tbl.tblPr.addnext(tbl_grid)
 
 
 def _set_row_height(row, height_twips: int, exact: bool = True) -> None:
@@ -207,11 +194,8 @@ def _set_row_height(row, height_twips: int, exact: bool = True) -> None:
         tr_pr.remove(existing_height)
 
     h_rule = "exact" if exact else "atLeast"
-    tr_height = parse_xml(
-        f'<w:trHeight xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" '
-        f'w:val="{height_twips}" w:hRule="{h_rule}"/>'
-    )
-    tr_pr.append(tr_height)
+    SubElement(tr_pr, qn('w:trHeight'),
+               {qn('w:val'): str(height_twips), qn('w:hRule'): h_rule})
 
 
 def _set_cell_width(cell, width_dxa: int) -> None:
@@ -230,10 +214,7 @@ def _set_cell_width(cell, width_dxa: int) -> None:
     if existing_width is not None:
         tc_pr.remove(existing_width)
 
-    tc_w = parse_xml(
-        f'<w:tcW xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" '
-        f'w:w="{width_dxa}" w:type="dxa"/>'
-    )
+    tc_w = tc_pr.makeelement(qn('w:tcW'), {qn('w:w'): str(width_dxa), qn('w:type'): 'dxa'})
     tc_pr.insert(0, tc_w)
 
 
@@ -253,11 +234,7 @@ def _set_cell_vertical_alignment(cell, alignment: str) -> None:
     if existing_valign is not None:
         tc_pr.remove(existing_valign)
 
-    v_align = parse_xml(
-        f'<w:vAlign xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" '
-        f'w:val="{alignment}"/>'
-    )
-    tc_pr.append(v_align)
+    SubElement(tc_pr, qn('w:vAlign'), {qn('w:val'): alignment})
 
 
 def _set_cell_shading(cell, color_hex: str) -> None:
@@ -270,11 +247,8 @@ def _set_cell_shading(cell, color_hex: str) -> None:
     """
     tc = cell._tc
     tc_pr = tc.get_or_add_tcPr()
-    shd = parse_xml(
-        f'<w:shd xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" '
-        f'w:val="clear" w:color="auto" w:fill="{color_hex}"/>'
-    )
-    tc_pr.append(shd)
+    SubElement(tc_pr, qn('w:shd'),
+               {qn('w:val'): 'clear', qn('w:color'): 'auto', qn('w:fill'): color_hex})
 
 
 def _add_cell_text(cell, text: str, size=None, bold: bool = False,
@@ -314,10 +288,7 @@ def _set_table_borders(table, config: Config) -> None:
     border_color_hex = grayscale_to_hex(config.table.border.grayscale)
     border_size = int(config.table.border.thickness * 8)  # Eighths of a point
 
-    tbl = table._tbl
-    tbl_pr = tbl.tblPr if tbl.tblPr is not None else parse_xml(
-        r'<w:tblPr xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"/>'
-    )
+    tbl_pr = table._tbl.tblPr
 
     tbl_borders = parse_xml(
         f'''<w:tblBorders xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">
@@ -331,5 +302,3 @@ def _set_table_borders(table, config: Config) -> None:
     )
 
     tbl_pr.append(tbl_borders)
-    if tbl.tblPr is None:
-        tbl.insert(0, tbl_pr)
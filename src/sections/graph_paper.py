@@ -5,13 +5,17 @@ Creates graph paper pages with configurable grid dimensions and colors.
 Each page has a grid on the recto with blank verso.
 """
 
+from copy import deepcopy
+from functools import lru_cache
 from pathlib import Path
 
 from docx import Document
+from docx.oxml.ns import qn
 from docx.shared import Cm, Pt
+from docx.text.paragraph import Paragraph
 
 from src.config import Config
-from src.document import add_page_break, get_content_width, get_content_height, add_config_info_overlay
+from src.document import add_page_break, add_config_info_overlay
 from src.utils.grid_image import generate_grid_image
 
 
@@ -22,10 +26,46 @@ PRINT_DPI = 300
 # 1 inch = 2.54 cm, so DPI / 2.54 = pixels per cm
 PX_PER_CM = PRINT_DPI / 2.54
 
+# Namespace-resolved tag of the drawing's shape properties
+_QN_DOCPR = qn('wp:docPr')
+
 # Image output directory (relative to project root)
 IMAGE_DIR = Path(__file__).parent.parent.parent / "assets" / "images"
 
 
+@lru_cache(maxsize=None)
+def _compute_graph_dims(
+    page_width: float, page_height: float,
+    margin_top: float, margin_bottom: float,
+    margin_left: float, margin_right: float,
+    gutter_size: float
+) -> tuple[float, float, int, int]:
+    """
+    Compute graph paper content area and image pixel dimensions.
+
+    Memoized on the page geometry so repeated graph paper sections with the
+    same layout skip the cm/px conversion and produce a stable cache key.
+    Mirrors get_content_width(include_gutter=True) and get_content_height().
+
+    Args:
+        page_width: Page width in cm.
+        page_height: Page height in cm.
+        margin_top: Top margin in cm.
+        margin_bottom: Bottom margin in cm.
+        margin_left: Left margin in cm.
+        margin_right: Right margin in cm.
+        gutter_size: Binding gutter in cm.
+
+    Returns:
+        Tuple of (content_width_cm, content_height_cm, width_px, height_px).
+    """
+    content_width_cm = page_width - margin_left - margin_right - gutter_size
+    content_height_cm = page_height - margin_top - margin_bottom
+    width_px = int(content_width_cm * PX_PER_CM)
+    height_px = int(content_height_cm * PX_PER_CM)
+    return content_width_cm, content_height_cm, width_px, height_px
+
+
 def generate_graph_paper(document: Document, config: Config) -> None:
     """
     Generate the graph paper section.
@@ -49,13 +89,14 @@ def generate_graph_paper(document: Document, config: Config) -> None:
     grid_color_percent = graph_config.get('grid_color_percent', 15)
     border_color_percent = graph_config.get('border_color_percent', 100)
 
-    # Calculate content area dimensions (with gutter for binding)
-    content_width_cm = get_content_width(config, include_gutter=True)
-    content_height_cm = get_content_height(config)
-
-    # Calculate image dimensions in pixels
-    width_px = int(content_width_cm * PX_PER_CM)
-    height_px = int(content_height_cm * PX_PER_CM)
+    # Content area (with gutter for binding) and image dimensions in pixels
+    page = config.page
+    content_width_cm, content_height_cm, width_px, height_px = _compute_graph_dims(
+        page.width, page.height,
+        page.margin_top, page.margin_bottom,
+        page.margin_left, page.margin_right,
+        page.gutter_size
+    )
 
     # Ensure image directory exists
     IMAGE_DIR.mkdir(parents=True, exist_ok=True)
@@ -82,19 +123,37 @@ def generate_graph_paper(document: Document, config: Config) -> None:
         )
 
     # Generate graph paper pages
+    # The first page inserts the picture normally; later pages clone its
+    # paragraph, which reuses the same image relationship and skips
+    # python-docx's per-picture setup (including its whole-document scan
+    # for the next free shape ID).
+    template_p = None
+    first_shape_id = 0
     for page_num in range(page_count):
-        # Insert image into document, sized to fill content area
-        document.add_picture(
-            str(image_path),
-            width=Cm(content_width_cm),
-            height=Cm(content_height_cm)
-        )
-
-        # Ensure the picture paragraph has no spacing
-        # (document.add_picture creates a new paragraph for the picture)
-        picture_para = document.paragraphs[-1]
-        picture_para.paragraph_format.space_before = Pt(0)
-        picture_para.paragraph_format.space_after = Pt(0)
+        if template_p is None:
+            # Insert image into document, sized to fill content area
+            picture_para = document.add_paragraph()
+            inline_shape = picture_para.add_run().add_picture(
+                str(image_path),
+                width=Cm(content_width_cm),
+                height=Cm(content_height_cm)
+            )
+
+            # Ensure the picture paragraph has no spacing
+            picture_para.paragraph_format.space_before = Pt(0)
+            picture_para.paragraph_format.space_after = Pt(0)
+
+            template_p = deepcopy(picture_para._p)
+            first_shape_id = inline_shape._inline.docPr.id
+        else:
+            # Clone the template, giving the drawing a unique shape ID
+            p = deepcopy(template_p)
+            shape_id = first_shape_id + page_num
+            doc_pr = p.find(f'.//{_QN_DOCPR}')
+            doc_pr.set('id', str(shape_id))
+            doc_pr.set('name', f"Picture {shape_id}")
+            document.element.body._insert_p(p)
+            picture_para = Paragraph(p, document._body)
 
         # Add overlay to grid page (recto)
         # Anchor to the picture's paragraph since the page is full
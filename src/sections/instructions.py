@@ -4,11 +4,13 @@ Instructions page generator for Year Planner.
 Generates a single page with the instructions image and a title overlay.
 """
 
+from copy import deepcopy
+from itertools import count
 from pathlib import Path
 
 from docx import Document
 from docx.oxml import parse_xml
-from docx.oxml.ns import nsmap
+from docx.oxml.ns import nsmap, qn
 from docx.shared import Cm, Pt
 
 from src.config import Config
@@ -21,6 +23,50 @@ IMAGE_DIR = Path(__file__).parent.parent.parent / "assets" / "images"
 # EMU conversion constant (914400 EMUs per inch, 1 inch = 2.54 cm)
 EMU_PER_CM = 914400 / 2.54
 
+# Sequential drawing IDs for title overlays (unique, unlike random IDs).
+# python-docx numbers pictures from the highest existing ID, so pictures
+# added later continue above this range
+_DOC_PR_IDS = count(1_000_000)
+
+# Namespace-resolved attribute name for w:sz/w:szCs values
+_QN_VAL = qn('w:val')
+
+# Title overlay DrawingML, parsed once at import. Position, size, ID, font size
+# and text are patched into a deep copy per overlay (transparent fill, no border)
+_TITLE_OVERLAY_TEMPLATE = parse_xml('''<w:drawing xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+        xmlns:wp="http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing"
+        xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main"
+        xmlns:wps="http://schemas.microsoft.com/office/word/2010/wordprocessingShape"
+        xmlns:wp14="http://schemas.microsoft.com/office/word/2010/wordprocessingDrawing">
+      <wp:anchor distT="0" distB="0" distL="114300" distR="114300"
+                 simplePos="0" relativeHeight="251660000" behindDoc="0"
+                 locked="0" layoutInCell="1" allowOverlap="1">
+        <wp:simplePos x="0" y="0"/>
+        <wp:positionH relativeFrom="page"><wp:posOffset>0</wp:posOffset></wp:positionH>
+        <wp:positionV relativeFrom="page"><wp:posOffset>0</wp:posOffset></wp:positionV>
+        <wp:extent cx="0" cy="0"/>
+        <wp:effectExtent l="0" t="0" r="0" b="0"/>
+        <wp:wrapNone/>
+        <wp:docPr id="0" name=""/>
+        <wp:cNvGraphicFramePr><a:graphicFrameLocks/></wp:cNvGraphicFramePr>
+        <a:graphic>
+          <a:graphicData uri="http://schemas.microsoft.com/office/word/2010/wordprocessingShape">
+            <wps:wsp>
+              <wps:cNvSpPr txBox="1"><a:spLocks noChangeArrowheads="1"/></wps:cNvSpPr>
+              <wps:spPr bwMode="auto">
+                <a:xfrm><a:off x="0" y="0"/><a:ext cx="0" cy="0"/></a:xfrm>
+                <a:prstGeom prst="rect"><a:avLst/></a:prstGeom>
+                <a:noFill/>
+                <a:ln><a:noFill/></a:ln>
+              </wps:spPr>
+              <wps:txbx><w:txbxContent><w:p><w:pPr><w:jc w:val="center"/><w:spacing w:after="0" w:line="432" w:lineRule="exact"/></w:pPr><w:r><w:rPr><w:rFonts w:ascii="Times New Roman" w:hAnsi="Times New Roman" w:cs="Times New Roman"/><w:b/><w:sz w:val="0"/><w:szCs w:val="0"/><w:color w:val="000000"/></w:rPr><w:t></w:t></w:r></w:p></w:txbxContent></wps:txbx>
+              <wps:bodyPr rot="0" vert="horz" wrap="square" lIns="91440" tIns="45720" rIns="91440" bIns="45720" anchor="t" anchorCtr="0" upright="1"><a:spAutoFit/></wps:bodyPr>
+            </wps:wsp>
+          </a:graphicData>
+        </a:graphic>
+      </wp:anchor>
+    </w:drawing>''')
+
 
 def generate_instructions_page(document: Document, config: Config) -> None:
     """
@@ -80,8 +126,6 @@ def _add_title_overlay(paragraph, config: Config, title_text: str) -> None:
         config: Configuration with page settings.
         title_text: The title text to display.
     """
-    import random
-
     # Title dimensions and position
     title_width_cm = 10.0  # Width of title text box
     title_height_cm = 1.2  # Height to accommodate 18pt text
@@ -111,45 +155,21 @@ def _add_title_overlay(paragraph, config: Config, title_text: str) -> None:
     font_size_half_pt = 36
 
     # Unique ID for this text box
-    doc_pr_id = random.randint(10000, 99999)
-
-    # Build DrawingML XML - using pattern from document.py with transparent fill
-    textbox_xml = f'''<w:drawing xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"
-        xmlns:wp="http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing"
-        xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main"
-        xmlns:wps="http://schemas.microsoft.com/office/word/2010/wordprocessingShape"
-        xmlns:wp14="http://schemas.microsoft.com/office/word/2010/wordprocessingDrawing">
-      <wp:anchor distT="0" distB="0" distL="114300" distR="114300"
-                 simplePos="0" relativeHeight="251660000" behindDoc="0"
-                 locked="0" layoutInCell="1" allowOverlap="1">
-        <wp:simplePos x="0" y="0"/>
-        <wp:positionH relativeFrom="page"><wp:posOffset>{x_emu}</wp:posOffset></wp:positionH>
-        <wp:positionV relativeFrom="page"><wp:posOffset>{y_emu}</wp:posOffset></wp:positionV>
-        <wp:extent cx="{width_emu}" cy="{height_emu}"/>
-        <wp:effectExtent l="0" t="0" r="0" b="0"/>
-        <wp:wrapNone/>
-        <wp:docPr id="{doc_pr_id}" name="TitleOverlay_{doc_pr_id}"/>
-        <wp:cNvGraphicFramePr><a:graphicFrameLocks/></wp:cNvGraphicFramePr>
-        <a:graphic>
-          <a:graphicData uri="http://schemas.microsoft.com/office/word/2010/wordprocessingShape">
-            <wps:wsp>
-              <wps:cNvSpPr txBox="1"><a:spLocks noChangeArrowheads="1"/></wps:cNvSpPr>
-              <wps:spPr bwMode="auto">
-                <a:xfrm><a:off x="0" y="0"/><a:ext cx="{width_emu}" cy="{height_emu}"/></a:xfrm>
-                <a:prstGeom prst="rect"><a:avLst/></a:prstGeom>
-                <a:noFill/>
-                <a:ln><a:noFill/></a:ln>
-              </wps:spPr>
-              <wps:txbx><w:txbxContent><w:p><w:pPr><w:jc w:val="center"/><w:spacing w:after="0" w:line="432" w:lineRule="exact"/></w:pPr><w:r><w:rPr><w:rFonts w:ascii="Times New Roman" w:hAnsi="Times New Roman" w:cs="Times New Roman"/><w:b/><w:sz w:val="{font_size_half_pt}"/><w:szCs w:val="{font_size_half_pt}"/><w:color w:val="000000"/></w:rPr><w:t>{title_text}</w:t></w:r></w:p></w:txbxContent></wps:txbx>
-              <wps:bodyPr rot="0" vert="horz" wrap="square" lIns="91440" tIns="45720" rIns="91440" bIns="45720" anchor="t" anchorCtr="0" upright="1"><a:spAutoFit/></wps:bodyPr>
-            </wps:wsp>
-          </a:graphicData>
-        </a:graphic>
-      </wp:anchor>
-    </w:drawing>'''
-
-    # Parse and add to paragraph
-    drawing = parse_xml(textbox_xml)
+    doc_pr_id = next(_DOC_PR_IDS)
+
+    # Clone the pre-parsed template and patch the variable parts in place
+    drawing = deepcopy(_TITLE_OVERLAY_TEMPLATE)
+    drawing.find('.//wp:positionH/wp:posOffset', nsmap).text = str(x_emu)
+    drawing.find('.//wp:positionV/wp:posOffset', nsmap).text = str(y_emu)
+    for extent in (drawing.find('.//wp:extent', nsmap), drawing.find('.//a:xfrm/a:ext', nsmap)):
+        extent.set('cx', str(width_emu))
+        extent.set('cy', str(height_emu))
+    doc_pr = drawing.find('.//wp:docPr', nsmap)
+    doc_pr.set('id', str(doc_pr_id))
+    doc_pr.set('name', f"TitleOverlay_{doc_pr_id}")
+    for size in (drawing.find('.//w:rPr/w:sz', nsmap), drawing.find('.//w:rPr/w:szCs', nsmap)):
+        size.set(_QN_VAL, str(font_size_half_pt))
+    drawing.find('.//w:t', nsmap).text = title_text
 
     # Add a run to the paragraph and append the drawing
     run = paragraph.add_run()
@@ -5,23 +5,26 @@ Generates month cover pages and daily spreads for each month.
 """
 
 import calendar
-from datetime import date
+from dataclasses import dataclass
+from copy import deepcopy
+from datetime import date, timedelta
 from docx import Document
-from docx.shared import Pt, RGBColor
-from docx.enum.text import WD_ALIGN_PARAGRAPH, WD_LINE_SPACING
-from docx.enum.table import WD_TABLE_ALIGNMENT
-from docx.oxml.ns import qn
+from docx.shared import Pt
 from docx.oxml import parse_xml
+from docx.oxml.ns import qn
+from docx.text.paragraph import Paragraph
 
 from src.config import Config
 from src.document import (
     add_page_break, add_config_info_overlay, get_content_width_twips,
     get_content_height_twips, TWIPS_PER_CM, TWIPS_PER_PT,
     get_title_row_height_twips, get_header_row_height_twips,
-    grayscale_to_hex, grayscale_to_rgb, MINIMIZED_PARAGRAPH_HEIGHT_TWIPS,
-    SAFETY_MARGIN_TWIPS
+    grayscale_to_hex, MINIMIZED_PARAGRAPH_HEIGHT_TWIPS,
+    SAFETY_MARGIN_TWIPS, EMPTY_PARAGRAPH_HEIGHT_TWIPS
 )
+from src.utils.dates import ORDINAL_SUFFIXES
 from src.utils.styles import FONT_NAME, FONT_SIZE_TITLE, COLOR_BLACK
+from src.utils.tables import append_table, get_body_sect_pr
 
 
 # Month names for cover pages
@@ -33,6 +36,106 @@ MONTH_NAMES = [
 # Day names
 DAY_NAMES = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
 
+# Empty lines of vertical space above the month name on a month cover
+MONTH_COVER_SPACER_LINES = 12
+
+# Namespace-resolved tags used to reach the day table title cells
+_QN_TR = qn('w:tr')
+_QN_TC = qn('w:tc')
+_QN_T = qn('w:t')
+
+
+@dataclass(frozen=True, slots=True)
+class DailyLayout:
+    """Day table geometry and styling shared by every daily spread."""
+    num_content_rows: int
+    table_gap_cm: float
+    total_width: int           # Table width in twips
+    subject_width: int         # Subject column width in twips
+    description_width: int     # Description column width in twips
+    title_row_h: int           # Title row height in twips
+    header_row_h: int          # Header row height in twips
+    content_row_h: int         # Content row height in twips
+    title_bg_hex: str
+    title_rpr_xml: str         # Title row run properties
+    header_bg_hex: str
+    header_rpr_xml: str        # Header row run properties
+    border_size: int           # Border width in eighths of a point
+    border_hex: str
+
+
+def _day_rpr_xml(font_size_pt: float, font_grayscale: int) -> str:
+    """
+    Build bold run properties for day table title and header text.
+
+    Args:
+        font_size_pt: Font size in points.
+        font_grayscale: Font color (0=white, 100=black).
+
+    Returns:
+        Serialized ``w:rPr`` element (without namespace declaration).
+    """
+    return (
+        f'<w:rPr><w:rFonts w:ascii="{FONT_NAME}" w:hAnsi="{FONT_NAME}"/><w:b/>'
+        f'<w:color w:val="{grayscale_to_hex(font_grayscale)}"/>'
+        f'<w:sz w:val="{int(font_size_pt * 2)}"/>'  # Half-points
+        f'</w:rPr>'
+    )
+
+
+def _build_daily_layout(config: Config) -> DailyLayout:
+    """
+    Compute the day table layout once for all 12 months.
+
+    Colors and fonts are resolved to hex strings and serialized run
+    properties here, so no per-table styling conversions remain.
+
+    Args:
+        config: Configuration with page, table and daily spread settings.
+
+    Returns:
+        DailyLayout with widths, row heights and colors resolved.
+    """
+    # Get config values
+    daily_config = config.raw.get('daily_spread', {})
+    num_content_rows = daily_config.get('rows', 8)
+    subject_width_percent = daily_config.get('subject_width_percent', 25)
+    table_gap_cm = daily_config.get('table_gap', 0.5)
+
+    # Calculate table dimensions
+    title_row_height = get_title_row_height_twips(config)
+    header_row_height = get_header_row_height_twips(config)
+    total_width = get_content_width_twips(config)
+
+    # Calculate content row height for 2 tables per page
+    content_row_height = _calculate_day_table_row_height(
+        config, num_content_rows, title_row_height, header_row_height, table_gap_cm
+    )
+
+    # Calculate column widths
+    subject_width = int(total_width * subject_width_percent / 100)
+    description_width = total_width - subject_width
+
+    # Get styling from config
+    return DailyLayout(
+        num_content_rows=num_content_rows,
+        table_gap_cm=table_gap_cm,
+        total_width=total_width,
+        subject_width=subject_width,
+        description_width=description_width,
+        title_row_h=title_row_height,
+        header_row_h=header_row_height,
+        content_row_h=int(content_row_height),
+        title_bg_hex=grayscale_to_hex(config.table.title_row.background_grayscale),
+        title_rpr_xml=_day_rpr_xml(config.table.title_row.font_size,
+                                   config.table.title_row.font_grayscale),
+        header_bg_hex=grayscale_to_hex(config.table.header_row.background_grayscale),
+        header_rpr_xml=_day_rpr_xml(config.table.header_row.font_size,
+                                    config.table.header_row.font_grayscale),
+        border_size=int(config.table.border.thickness * 8),
+        border_hex=grayscale_to_hex(config.table.border.grayscale)
+    )
+
 
 def generate_monthly_sections(document: Document, config: Config) -> None:
     """
@@ -52,22 +155,37 @@ def generate_monthly_sections(document: Document, config: Config) -> None:
     """
     year = config.document.year
 
+    # Day table layout is identical for every month, so compute it once
+    # and build a single template table that every day clones
+    layout = _build_daily_layout(config)
+    day_table_template = _build_day_table_template(layout)
+    gap_template = _build_table_gap_template(layout.table_gap_cm)
+    day_labels = _build_day_labels(year)
+
+    overlay_enabled = config.debug.config_info_overlay
+    body_sect_pr = get_body_sect_pr(document)
+
     for month_num in range(1, 13):
         month_name = MONTH_NAMES[month_num - 1]
 
-        # === MONTH COVER (on recto) ===
+        # === MONTH COVER (on recto), BLANK VERSO, DAILY SPREAD START ===
         # Each month starts on recto because previous month's daily spread
         # guarantees it ends on verso. First month starts on recto from main.py.
-        _generate_month_cover(document, config, month_name)
-        add_config_info_overlay(document, config, is_recto=True)
-
-        # === BLANK VERSO (after cover) ===
-        add_page_break(document)
-        add_config_info_overlay(document, config, is_recto=False)
+        # The cover, blank verso and both page breaks are parsed in one go.
+        intro = list(parse_xml(_month_intro_xml(month_name, overlay_enabled)))
+        for p in intro:
+            body_sect_pr.addprevious(p)
+
+        if overlay_enabled:
+            _, _, cover_anchor, _, verso_anchor, _ = intro
+            add_config_info_overlay(document, config, is_recto=True,
+                                    anchor_paragraph=Paragraph(cover_anchor, document._body))
+            add_config_info_overlay(document, config, is_recto=False,
+                                    anchor_paragraph=Paragraph(verso_anchor, document._body))
 
         # === DAILY SPREAD (starts on recto, guarantees end on verso) ===
-        add_page_break(document)
-        _generate_daily_spread(document, config, year, month_num)
+        _generate_daily_spread(document, config, body_sect_pr, year, month_num,
+                               day_table_template, gap_template, day_labels)
 
         # Daily spread guarantees it ends on verso.
         # Add MINIMIZED page break to get to recto for next month's cover.
@@ -76,9 +194,9 @@ def generate_monthly_sections(document: Document, config: Config) -> None:
             add_page_break(document, minimize_height=True)
 
 
-def _generate_month_cover(document: Document, config: Config, month_name: str) -> None:
+def _month_intro_xml(month_name: str, with_overlay_anchors: bool) -> str:
     """
-    Generate a month cover page.
+    Build the month cover, its blank verso and the page breaks around them.
 
     Layout:
     - Vertically centered month name (36pt, bold, centered)
@@ -86,29 +204,47 @@ def _generate_month_cover(document: Document, config: Config, month_name: str) -
     The month name is positioned approximately 1/3 down the page
     for visual balance.
 
+    Paragraphs, in order:
+    - Spacer, month name, [cover overlay anchor], page break (to verso)
+    - [verso overlay anchor], page break (to the daily spread recto)
+
     Args:
-        document: The Word document.
-        config: Configuration with document settings.
         month_name: Name of the month (e.g., "January").
+        with_overlay_anchors: Include the minimal overlay anchor paragraphs.
+
+    Returns:
+        Serialized paragraphs wrapped in a ``w:body`` element.
     """
-    # Add spacing paragraphs for vertical positioning
-    # Position month name approximately 1/3 down the page
-    # Using ~12 empty lines to push content down
-    for _ in range(12):
-        p = document.add_paragraph()
-        p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-
-    # Month name (36pt, bold, centered)
-    month_para = document.add_paragraph()
-    month_run = month_para.add_run(month_name)
-    month_run.font.name = FONT_NAME
-    month_run.font.size = FONT_SIZE_TITLE
-    month_run.font.bold = True
-    month_run.font.color.rgb = COLOR_BLACK
-    month_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-
-
-def _generate_daily_spread(document: Document, config: Config, year: int, month: int) -> None:
+    # A single exact-height spacer paragraph stands in for ~12 empty lines
+    spacer_twips = MONTH_COVER_SPACER_LINES * EMPTY_PARAGRAPH_HEIGHT_TWIPS
+    spacer = (
+        f'<w:p><w:pPr><w:spacing w:line="{spacer_twips}" w:lineRule="exact"/>'
+        f'<w:jc w:val="center"/></w:pPr>'
+        f'<w:r><w:rPr><w:sz w:val="2"/></w:rPr><w:t xml:space="preserve"> </w:t></w:r></w:p>'
+    )
+    month_para = (
+        f'<w:p><w:pPr><w:jc w:val="center"/></w:pPr><w:r><w:rPr>'
+        f'<w:rFonts w:ascii="{FONT_NAME}" w:hAnsi="{FONT_NAME}"/><w:b/>'
+        f'<w:color w:val="{COLOR_BLACK}"/>'
+        f'<w:sz w:val="{int(FONT_SIZE_TITLE.pt * 2)}"/>'  # Half-points
+        f'</w:rPr><w:t>{month_name}</w:t></w:r></w:p>'
+    )
+    page_break = '<w:p><w:r><w:br w:type="page"/></w:r></w:p>'
+    anchor = (
+        '<w:p><w:pPr><w:spacing w:before="0" w:after="0" w:line="20" '
+        'w:lineRule="exact"/></w:pPr></w:p>'
+    ) if with_overlay_anchors else ''
+
+    return (
+        '<w:body xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+        + spacer + month_para + anchor + page_break + anchor + page_break
+        + '</w:body>'
+    )
+
+
+def _generate_daily_spread(document: Document, config: Config, body_sect_pr,
+                           year: int, month: int, day_table_template, gap_template,
+                           day_labels: list[tuple[str, str]]) -> None:
     """
     Generate daily spread pages for a month.
 
@@ -121,37 +257,22 @@ def _generate_daily_spread(document: Document, config: Config, year: int, month:
     Args:
         document: The Word document.
         config: Configuration with document settings.
+        body_sect_pr: The document body's final <w:sectPr> element.
         year: The year.
         month: The month number (1-12).
+        day_table_template: Day table element cloned for each day.
+        gap_template: Gap paragraph element cloned between day tables.
+        day_labels: Title row labels for every day of the year.
     """
-    # Get config values
-    daily_config = config.raw.get('daily_spread', {})
-    num_content_rows = daily_config.get('rows', 8)
-    subject_width_percent = daily_config.get('subject_width_percent', 25)
-    table_gap_cm = daily_config.get('table_gap', 0.5)
-
     # Get all days in the month
     num_days = calendar.monthrange(year, month)[1]
-    days = [date(year, month, day) for day in range(1, num_days + 1)]
+    first_offset = (date(year, month, 1) - date(year, 1, 1)).days
+    days = day_labels[first_offset:first_offset + num_days]
 
     # Calculate number of page sides needed (2 tables per page side)
     # This determines the final page position
     num_page_sides = (num_days + 1) // 2  # Ceiling division for 2 tables per side
 
-    # Calculate table dimensions
-    title_row_height = get_title_row_height_twips(config)
-    header_row_height = get_header_row_height_twips(config)
-    total_width = get_content_width_twips(config)
-
-    # Calculate content row height for 2 tables per page
-    content_row_height = _calculate_day_table_row_height(
-        config, num_content_rows, title_row_height, header_row_height, table_gap_cm
-    )
-
-    # Calculate column widths
-    subject_width = int(total_width * subject_width_percent / 100)
-    description_width = total_width - subject_width
-
     # Generate pages with 2 tables each
     # Track page side for overlay positioning (1=recto, 2=verso, etc.)
     day_idx = 0
@@ -159,28 +280,15 @@ def _generate_daily_spread(document: Document, config: Config, year: int, month:
 
     while day_idx < len(days):
         is_recto = (page_side % 2 == 1)
-        anchor_para = None  # Will be set to gap paragraph if 2 tables on page
-
-        # First table on this page side
-        _create_day_table(
-            document, config, days[day_idx],
-            total_width, subject_width, description_width,
-            title_row_height, header_row_height, content_row_height,
-            num_content_rows
-        )
-        day_idx += 1
 
-        # Add gap and second table (only if there are more days)
-        if day_idx < len(days):
-            anchor_para = _add_table_gap(document, table_gap_cm)
+        # Both day tables on this page side (or one, if only one day remains)
+        second_day = days[day_idx + 1] if day_idx + 1 < len(days) else None
+        gap_p = _create_day_page_side(body_sect_pr, day_table_template, gap_template,
+                                      days[day_idx], second_day)
+        day_idx += 1 if second_day is None else 2
 
-            _create_day_table(
-                document, config, days[day_idx],
-                total_width, subject_width, description_width,
-                title_row_height, header_row_height, content_row_height,
-                num_content_rows
-            )
-            day_idx += 1
+        # Gap paragraph is the overlay anchor when there are 2 tables on the page
+        anchor_para = Paragraph(gap_p, document._body) if gap_p is not None else None
 
         # Add page break if more days remain
         if day_idx < len(days):
@@ -198,19 +306,11 @@ def _generate_daily_spread(document: Document, config: Config, year: int, month:
 
     # Handle last page if it had only 1 table (no anchor was available)
     # This happens for 31-day months where day 31 is alone on the last page
-    # Single-table pages have room for an anchor (only half the page is used)
+    # Single-table pages have room for the overlay's own minimal paragraph,
+    # which is only created when the overlay is enabled
     if anchor_para is None:
         last_page_is_recto = (page_side % 2 == 1)
-        # Create minimal anchor paragraph - won't overflow since page is half empty
-        anchor_para = document.add_paragraph()
-        anchor_para.paragraph_format.space_before = Pt(0)
-        anchor_para.paragraph_format.space_after = Pt(0)
-        anchor_para.paragraph_format.line_spacing = Pt(1)
-        anchor_para.paragraph_format.line_spacing_rule = WD_LINE_SPACING.EXACTLY
-        run = anchor_para.add_run()
-        run.font.size = Pt(1)
-        add_config_info_overlay(document, config, is_recto=last_page_is_recto,
-                                anchor_paragraph=anchor_para)
+        add_config_info_overlay(document, config, is_recto=last_page_is_recto)
 
     # Determine if we ended on recto or verso based on total page sides
     # Odd number of page sides = ends on recto, Even = ends on verso
@@ -220,17 +320,10 @@ def _generate_daily_spread(document: Document, config: Config, year: int, month:
     # Must be minimized because daily spread pages are full (tables fill them).
     if ends_on_recto:
         add_page_break(document, minimize_height=True)
-        # Create anchor paragraph ON the blank verso (after the page break)
-        # The page break paragraph itself is on the previous page (recto)
-        blank_verso_anchor = document.add_paragraph()
-        blank_verso_anchor.paragraph_format.space_before = Pt(0)
-        blank_verso_anchor.paragraph_format.space_after = Pt(0)
-        blank_verso_anchor.paragraph_format.line_spacing = Pt(1)
-        blank_verso_anchor.paragraph_format.line_spacing_rule = WD_LINE_SPACING.EXACTLY
-        run = blank_verso_anchor.add_run()
-        run.font.size = Pt(1)
-        add_config_info_overlay(document, config, is_recto=False,
-                                anchor_paragraph=blank_verso_anchor)
+        # Overlay goes ON the blank verso (after the page break), in its own
+        # minimal paragraph. The page break paragraph itself is on the
+        # previous page (recto)
+        add_config_info_overlay(document, config, is_recto=False)
 
 
 def _calculate_day_table_row_height(
@@ -281,327 +374,223 @@ def _calculate_day_table_row_height(
     return content_area // num_content_rows
 
 
-def _add_table_gap(document: Document, gap_cm: float):
+def _build_table_gap_template(gap_cm: float):
     """
-    Add a gap paragraph between day tables.
+    Build the gap paragraph placed between the two day tables on a page side.
 
-    Uses exact line spacing to create a precise gap height.
+    Uses exact line spacing to create a precise gap height. The paragraph
+    holds a 1pt space character because empty paragraphs can collapse.
+    It also serves as the overlay anchor for its page.
 
     Args:
-        document: The Word document.
         gap_cm: Gap size in centimeters.
 
     Returns:
-        The gap paragraph (can be used as anchor for overlays).
+        The <w:p> element, not attached to any document.
     """
-    gap_para = document.add_paragraph()
-    gap_para.paragraph_format.space_before = Pt(0)
-    gap_para.paragraph_format.space_after = Pt(0)
-
     # Convert cm to points (1 cm ≈ 28.35 points)
-    gap_pt = gap_cm * 28.35
+    gap_twips = Pt(gap_cm * 28.35).twips
 
-    # Use exact line spacing to create the gap
-    # The paragraph needs minimal content for line spacing to apply
-    gap_para.paragraph_format.line_spacing_rule = WD_LINE_SPACING.EXACTLY
-    gap_para.paragraph_format.line_spacing = Pt(gap_pt)
-
-    # Add a space character so the paragraph has content
-    # (empty paragraphs can collapse)
-    run = gap_para.add_run(" ")
-    run.font.size = Pt(1)  # Minimal font size
-
-    return gap_para
+    return parse_xml(
+        '<w:p xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+        f'<w:pPr><w:spacing w:before="0" w:after="0" w:line="{gap_twips}" w:lineRule="exact"/></w:pPr>'
+        '<w:r><w:rPr><w:sz w:val="2"/></w:rPr><w:t xml:space="preserve"> </w:t></w:r>'
+        '</w:p>'
+    )
 
 
-def _create_day_table(
-    document: Document,
-    config: Config,
-    day: date,
-    total_width: int,
-    subject_width: int,
-    description_width: int,
-    title_row_height: int,
-    header_row_height: int,
-    content_row_height: int,
-    num_content_rows: int
-) -> None:
+def _day_cell_xml(width: int = None, text: str = "", bg_hex: str = None,
+                  rpr_xml: str = "", align: str = "left") -> str:
     """
-    Create a single day table.
-
-    Structure:
-    - Title row: Day name (left) | Date string (right)
-    - Header row: Subject | Description
-    - Content rows: Empty cells for user input
+    Build the XML for one day table cell.
 
     Args:
-        document: The Word document.
-        config: Configuration settings.
-        day: The date for this table.
-        total_width: Total table width in twips.
-        subject_width: Subject column width in twips.
-        description_width: Description column width in twips.
-        title_row_height: Title row height in twips.
-        header_row_height: Header row height in twips.
-        content_row_height: Content row height in twips.
-        num_content_rows: Number of content rows.
-    """
-    # Create table: title + header + content rows
-    total_rows = 2 + num_content_rows
-    table = document.add_table(rows=total_rows, cols=2)
-    table.alignment = WD_TABLE_ALIGNMENT.CENTER
-    table.autofit = False
-
-    # Set fixed table layout
-    _set_table_layout_fixed(table)
+        width: Cell width in twips, or None to take the width from the
+               table grid (the table layout is fixed).
+        text: Cell text. Empty cells get a bare paragraph.
+        bg_hex: Background fill color, or None for no shading.
+        rpr_xml: Run properties XML for the cell text.
+        align: Paragraph alignment ("left" or "right").
 
-    # Set column widths
-    col_widths = [subject_width, description_width]
-    _set_table_grid(table, col_widths)
-
-    # Get styling from config
-    title_bg_hex = grayscale_to_hex(config.table.title_row.background_grayscale)
-    title_font_rgb = grayscale_to_rgb(config.table.title_row.font_grayscale)
-    title_font_color = RGBColor(*title_font_rgb)
-    title_font_size = Pt(config.table.title_row.font_size)
-
-    header_bg_hex = grayscale_to_hex(config.table.header_row.background_grayscale)
-    header_font_rgb = grayscale_to_rgb(config.table.header_row.font_grayscale)
-    header_font_color = RGBColor(*header_font_rgb)
-    header_font_size = Pt(config.table.header_row.font_size)
-
-    # === TITLE ROW ===
-    title_row = table.rows[0]
-    _set_row_height(title_row, title_row_height)
-
-    # Day name (left cell)
-    day_name = DAY_NAMES[day.weekday()]
-    day_cell = title_row.cells[0]
-    _set_cell_width(day_cell, subject_width)
-    _set_cell_shading(day_cell, title_bg_hex)
-    _set_cell_vertical_alignment(day_cell, "center")
-    _add_cell_text(day_cell, day_name, size=title_font_size, bold=True,
-                   color=title_font_color, align=WD_ALIGN_PARAGRAPH.LEFT)
-
-    # Date string (right cell)
-    date_str = _format_date_string(day)
-    date_cell = title_row.cells[1]
-    _set_cell_width(date_cell, description_width)
-    _set_cell_shading(date_cell, title_bg_hex)
-    _set_cell_vertical_alignment(date_cell, "center")
-    _add_cell_text(date_cell, date_str, size=title_font_size, bold=True,
-                   color=title_font_color, align=WD_ALIGN_PARAGRAPH.RIGHT)
-
-    # === HEADER ROW ===
-    header_row = table.rows[1]
-    _set_row_height(header_row, header_row_height)
-
-    # Subject header
-    subject_cell = header_row.cells[0]
-    _set_cell_width(subject_cell, subject_width)
-    _set_cell_shading(subject_cell, header_bg_hex)
-    _set_cell_vertical_alignment(subject_cell, "center")
-    _add_cell_text(subject_cell, "Subject", size=header_font_size, bold=True,
-                   color=header_font_color, align=WD_ALIGN_PARAGRAPH.LEFT)
-
-    # Description header
-    desc_cell = header_row.cells[1]
-    _set_cell_width(desc_cell, description_width)
-    _set_cell_shading(desc_cell, header_bg_hex)
-    _set_cell_vertical_alignment(desc_cell, "center")
-    _add_cell_text(desc_cell, "Description", size=header_font_size, bold=True,
-                   color=header_font_color, align=WD_ALIGN_PARAGRAPH.LEFT)
-
-    # === CONTENT ROWS ===
-    for row_idx in range(num_content_rows):
-        row = table.rows[row_idx + 2]
-        _set_row_height(row, content_row_height)
-
-        # Subject cell
-        subj_cell = row.cells[0]
-        _set_cell_width(subj_cell, subject_width)
-        _set_cell_vertical_alignment(subj_cell, "center")
-
-        # Description cell
-        desc_cell = row.cells[1]
-        _set_cell_width(desc_cell, description_width)
-        _set_cell_vertical_alignment(desc_cell, "center")
-
-    # Apply borders
-    _set_table_borders(table, config)
-
-
-def _format_date_string(day: date) -> str:
+    Returns:
+        Serialized ``w:tc`` element (without namespace declaration).
     """
-    Format date as "Month Nth,  YYYY-MM-DD,  Week #".
-
-    Two spaces after each comma for visual spacing.
+    cell_width = f'<w:tcW w:w="{width}" w:type="dxa"/>' if width is not None else ''
+    shading = f'<w:shd w:val="clear" w:color="auto" w:fill="{bg_hex}"/>' if bg_hex else ''
+    if text:
+        para = (
+            f'<w:p><w:pPr><w:jc w:val="{align}"/></w:pPr>'
+            f'<w:r>{rpr_xml}<w:t>{text}</w:t></w:r></w:p>'
+        )
+    else:
+        para = '<w:p/>'
+    return (
+        f'<w:tc><w:tcPr>{cell_width}{shading}'
+        f'<w:vAlign w:val="center"/></w:tcPr>{para}</w:tc>'
+    )
 
-    Args:
-        day: The date to format.
 
-    Returns:
-        Formatted date string (e.g., "January 1st,  2026-01-01,  Week 1").
+def _day_table_xml(layout: DailyLayout) -> str:
     """
-    month_name = MONTH_NAMES[day.month - 1]
-    ordinal = _get_ordinal_suffix(day.day)
-    iso_date = day.strftime("%Y-%m-%d")
-    week_num = day.isocalendar()[1]
-    return f"{month_name} {day.day}{ordinal},  {iso_date},  Week {week_num}"
+    Build the complete day table as a single XML string.
 
+    Structure:
+    - Title row: Day name (left) | Date string (right)
+    - Header row: Subject | Description
+    - Content rows: Empty cells for user input
 
-def _get_ordinal_suffix(n: int) -> str:
-    """
-    Get ordinal suffix for a number (st, nd, rd, th).
+    The title row holds placeholder text that _clone_day_table replaces.
 
     Args:
-        n: The number.
+        layout: Precomputed day table layout.
 
     Returns:
-        Ordinal suffix string.
+        Serialized ``w:tbl`` element.
     """
-    if 11 <= n <= 13:
-        return "th"
-    return {1: "st", 2: "nd", 3: "rd"}.get(n % 10, "th")
-
+    subject_width = layout.subject_width
+    description_width = layout.description_width
+    title_rpr = layout.title_rpr_xml
+    header_rpr = layout.header_rpr_xml
+
+    border = f'w:val="single" w:sz="{layout.border_size}" w:color="{layout.border_hex}"'
+    borders = ''.join(
+        f'<w:{edge} {border}/>'
+        for edge in ('top', 'left', 'bottom', 'right', 'insideH', 'insideV')
+    )
 
-# === Table Helper Functions ===
+    # === TITLE ROW === (day name and date string are replaced per day)
+    title_row = (
+        f'<w:tr><w:trPr><w:trHeight w:val="{layout.title_row_h}" w:hRule="exact"/></w:trPr>'
+        + _day_cell_xml(subject_width, DAY_NAMES[0], layout.title_bg_hex, title_rpr)
+        + _day_cell_xml(description_width, MONTH_NAMES[0], layout.title_bg_hex,
+                        title_rpr, align="right")
+        + '</w:tr>'
+    )
 
-def _set_table_layout_fixed(table) -> None:
-    """Set table layout to fixed."""
-    tbl = table._tbl
-    tbl_pr = tbl.tblPr
-    if tbl_pr is None:
-        tbl_pr = parse_xml(
-            r'<w:tblPr xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"/>'
-        )
-        tbl.insert(0, tbl_pr)
+    # === HEADER ROW ===
+    header_row = (
+        f'<w:tr><w:trPr><w:trHeight w:val="{layout.header_row_h}" w:hRule="exact"/></w:trPr>'
+        + _day_cell_xml(subject_width, "Subject", layout.header_bg_hex, header_rpr)
+        + _day_cell_xml(description_width, "Description", layout.header_bg_hex, header_rpr)
+        + '</w:tr>'
+    )
 
-    tbl_layout = parse_xml(
-        '<w:tblLayout xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" '
-        'w:type="fixed"/>'
+    # === CONTENT ROWS === (all identical, so one row is built and repeated)
+    # Cell widths come from tblGrid, which Word honors under the fixed layout
+    content_row = (
+        f'<w:tr><w:trPr><w:trHeight w:val="{layout.content_row_h}" w:hRule="exact"/></w:trPr>'
+        + _day_cell_xml() * 2
+        + '</w:tr>'
     )
-    tbl_pr.append(tbl_layout)
 
+    return (
+        '<w:tbl xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+        '<w:tblPr><w:tblW w:w="0" w:type="auto"/><w:jc w:val="center"/>'
+        '<w:tblLayout w:type="fixed"/>'
+        '<w:tblLook w:val="04A0" w:firstRow="1" w:lastRow="0" w:firstColumn="1" '
+        'w:lastColumn="0" w:noHBand="0" w:noVBand="1"/>'
+        f'<w:tblBorders>{borders}</w:tblBorders></w:tblPr>'
+        f'<w:tblGrid><w:gridCol w:w="{subject_width}"/>'
+        f'<w:gridCol w:w="{description_width}"/></w:tblGrid>'
+        + title_row
+        + header_row
+        + content_row * layout.num_content_rows
+        + '</w:tbl>'
+    )
 
-def _set_table_grid(table, col_widths: list[int]) -> None:
-    """Set the table grid column widths."""
-    tbl = table._tbl
 
-    existing_grid = tbl.find(qn('w:tblGrid'))
-    if existing_grid is not None:
-        tbl.remove(existing_grid)
+def _build_day_table_template(layout: DailyLayout):
+    """
+    Build the day table once for cloning.
 
-    grid_xml = '<w:tblGrid xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
-    for width in col_widths:
-        grid_xml += f'<w:gridCol w:w="{width}"/>'
-    grid_xml += '</w:tblGrid>'
+    Every day table shares the same structure and styling; only the day name
+    and date string in the title row differ, and _clone_day_table patches
+    those on each copy.
 
-    tbl_grid = parse_xml(grid_xml)
+    Args:
+        layout: Precomputed day table layout.
 
-    tbl_pr = tbl.tblPr
-    if tbl_pr is not None:
-        tbl_pr.addnext(tbl_grid)
-    else:
-        tbl.insert(0, tbl_grid)
+    Returns:
+        The <w:tbl> element, not attached to any document.
+    """
+    return parse_xml(_day_table_xml(layout))
 
 
-def _set_row_height(row, height_twips: int, exact: bool = True) -> None:
-    """Set the row height in twips."""
-    tr = row._tr
-    tr_pr = tr.get_or_add_trPr()
+def _create_day_page_side(body_sect_pr, template_tbl, gap_template,
+                          first_day: tuple[str, str],
+                          second_day: tuple[str, str] = None):
+    """
+    Create the day tables for one page side.
 
-    existing_height = tr_pr.find(qn('w:trHeight'))
-    if existing_height is not None:
-        tr_pr.remove(existing_height)
+    Clones the day table template for each day and fills in the title row.
+    The two tables and the gap paragraph between them are inserted together.
 
-    h_rule = "exact" if exact else "atLeast"
-    tr_height = parse_xml(
-        f'<w:trHeight xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" '
-        f'w:val="{height_twips}" w:hRule="{h_rule}"/>'
-    )
-    tr_pr.append(tr_height)
+    Args:
+        body_sect_pr: The document body's final <w:sectPr> element.
+        template_tbl: Day table element from _build_day_table_template.
+        gap_template: Gap paragraph element from _build_table_gap_template.
+        first_day: (day_name, date_str) for the upper table.
+        second_day: (day_name, date_str) for the lower table, or None when
+                    only one day remains.
 
+    Returns:
+        The gap paragraph element, or None for a single-table page side.
+    """
+    append_table(body_sect_pr, _clone_day_table(template_tbl, *first_day))
+    if second_day is None:
+        return None
 
-def _set_cell_width(cell, width_dxa: int) -> None:
-    """Set cell width in dxa (twips)."""
-    tc = cell._tc
-    tc_pr = tc.get_or_add_tcPr()
+    gap_p = deepcopy(gap_template)
+    body_sect_pr.addprevious(gap_p)
+    append_table(body_sect_pr, _clone_day_table(template_tbl, *second_day))
+    return gap_p
 
-    existing_width = tc_pr.find(qn('w:tcW'))
-    if existing_width is not None:
-        tc_pr.remove(existing_width)
 
-    tc_w = parse_xml(
-        f'<w:tcW xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" '
-        f'w:w="{width_dxa}" w:type="dxa"/>'
-    )
-    tc_pr.insert(0, tc_w)
+def _clone_day_table(template_tbl, day_name: str, date_str: str):
+    """
+    Clone the day table template and fill in the title row.
 
+    Args:
+        template_tbl: Day table element from _build_day_table_template.
+        day_name: Day name for the title row's left cell.
+        date_str: Date string for the title row's right cell.
 
-def _set_cell_vertical_alignment(cell, alignment: str) -> None:
-    """Set vertical alignment of a cell."""
-    tc = cell._tc
-    tc_pr = tc.get_or_add_tcPr()
+    Returns:
+        The new <w:tbl> element.
+    """
+    tbl = deepcopy(template_tbl)
 
-    existing_valign = tc_pr.find(qn('w:vAlign'))
-    if existing_valign is not None:
-        tc_pr.remove(existing_valign)
+    # The title row is the first row; its two cells hold the day name and
+    # date string
+    title_tr = tbl.find(_QN_TR)
+    for tc, text in zip(title_tr.iterfind(_QN_TC), (day_name, date_str)):
+        next(tc.iter(_QN_T)).text = text
+    return tbl
 
-    v_align = parse_xml(
-        f'<w:vAlign xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" '
-        f'w:val="{alignment}"/>'
-    )
-    tc_pr.append(v_align)
 
+def _build_day_labels(year: int) -> list[tuple[str, str]]:
+    """
+    Build the title row labels for every day of the year in one pass.
 
-def _set_cell_shading(cell, color_hex: str) -> None:
-    """Set the background shading color of a cell."""
-    tc = cell._tc
-    tc_pr = tc.get_or_add_tcPr()
-    shd = parse_xml(
-        f'<w:shd xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" '
-        f'w:val="clear" w:color="auto" w:fill="{color_hex}"/>'
-    )
-    tc_pr.append(shd)
-
-
-def _add_cell_text(cell, text: str, size=None, bold: bool = False,
-                   color=COLOR_BLACK, align=None) -> None:
-    """Add formatted text to a table cell."""
-    para = cell.paragraphs[0]
-    if align is not None:
-        para.alignment = align
-    run = para.add_run(text)
-    run.font.name = FONT_NAME
-    if size is not None:
-        run.font.size = size
-    if bold:
-        run.font.bold = bold
-    run.font.color.rgb = color
-
-
-def _set_table_borders(table, config: Config) -> None:
-    """Set table borders using config settings."""
-    border_color_hex = grayscale_to_hex(config.table.border.grayscale)
-    border_size = int(config.table.border.thickness * 8)
-
-    tbl = table._tbl
-    tbl_pr = tbl.tblPr if tbl.tblPr is not None else parse_xml(
-        r'<w:tblPr xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"/>'
-    )
+    Date strings are formatted as "Month Nth,  YYYY-MM-DD,  Week #", with
+    two spaces after each comma for visual spacing.
 
-    tbl_borders = parse_xml(
-        f'''<w:tblBorders xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">
-            <w:top w:val="single" w:sz="{border_size}" w:color="{border_color_hex}"/>
-            <w:left w:val="single" w:sz="{border_size}" w:color="{border_color_hex}"/>
-            <w:bottom w:val="single" w:sz="{border_size}" w:color="{border_color_hex}"/>
-            <w:right w:val="single" w:sz="{border_size}" w:color="{border_color_hex}"/>
-            <w:insideH w:val="single" w:sz="{border_size}" w:color="{border_color_hex}"/>
-            <w:insideV w:val="single" w:sz="{border_size}" w:color="{border_color_hex}"/>
-        </w:tblBorders>'''
-    )
+    Args:
+        year: The year.
 
-    tbl_pr.append(tbl_borders)
-    if tbl.tblPr is None:
-        tbl.insert(0, tbl_pr)
+    Returns:
+        List of (day_name, date_str) tuples, one per day from 1 January
+        (e.g., ("Thursday", "January 1st,  2026-01-01,  Week 1")).
+    """
+    first_day = date(year, 1, 1)
+    num_days = (date(year + 1, 1, 1) - first_day).days
+
+    labels = []
+    for offset in range(num_days):
+        day = first_day + timedelta(days=offset)
+        date_str = (
+            f"{MONTH_NAMES[day.month - 1]} {day.day}{ORDINAL_SUFFIXES[day.day]},  "
+            f"{day.isoformat()},  Week {day.isocalendar()[1]}"
+        )
+        labels.append((DAY_NAMES[day.weekday()], date_str))
+    return labels
@@ -26,7 +26,7 @@ def generate_rear_cover(document: Document, config: Config) -> None:
     para = document.add_paragraph()
     para.paragraph_format.space_before = 0
     para.paragraph_format.space_after = 0
-    add_config_info_overlay(document, config, is_recto=True)
+    add_config_info_overlay(document, config, is_recto=True, anchor_paragraph=para)
 
     # Outside rear cover (verso) - blank
     add_page_break(document)
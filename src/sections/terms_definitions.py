@@ -4,10 +4,10 @@ Terms and Definitions section generator for Year Planner.
 Generates multi-page tables for recording terms and their definitions.
 """
 
+from copy import deepcopy
+from dataclasses import dataclass
+
 from docx import Document
-from docx.shared import Pt, RGBColor
-from docx.enum.table import WD_TABLE_ALIGNMENT
-from docx.oxml.ns import qn
 from docx.oxml import parse_xml
 
 from src.config import Config
@@ -15,9 +15,10 @@ from src.document import (
     add_page_break, get_content_width_twips, compute_table_row_height,
     MINIMIZED_PARAGRAPH_HEIGHT_TWIPS, add_config_info_overlay,
     get_title_row_height_twips, get_header_row_height_twips,
-    grayscale_to_hex, grayscale_to_rgb
+    grayscale_to_hex
 )
-from src.utils.styles import FONT_NAME, COLOR_BLACK
+from src.utils.styles import FONT_NAME
+from src.utils.tables import append_table, get_body_sect_pr
 
 
 def generate_terms_definitions(document: Document, config: Config) -> None:
@@ -38,6 +39,13 @@ def generate_terms_definitions(document: Document, config: Config) -> None:
     row_count = td_config.get('row_count', 16)
     term_width_percent = td_config.get('term_width_percent', 25)
 
+    # Every page has the same table, so build and parse it once and give
+    # each page a copy
+    style = _build_terms_style(config, row_count, term_width_percent)
+    table_template = parse_xml(_terms_table_xml(style))
+
+    body_sect_pr = get_body_sect_pr(document)
+
     # Generate pages
     for page_num in range(page_count):
         # Add minimized page break between pages (not before first)
@@ -46,17 +54,27 @@ def generate_terms_definitions(document: Document, config: Config) -> None:
             add_page_break(document, minimize_height=True)
 
         # Create the table for this page
-        _create_terms_table(document, config, row_count, term_width_percent)
+        _create_terms_table(body_sect_pr, table_template)
 
         # Add overlay - first page is recto, then alternates
         is_recto = (page_num % 2 == 0)
         add_config_info_overlay(document, config, is_recto=is_recto)
 
 
-def _create_terms_table(document: Document, config: Config,
-                        row_count: int, term_width_percent: int) -> None:
+@dataclass(frozen=True, slots=True)
+class _TermsStyle:
+    """Pre-rendered XML fragments shared by every terms and definitions table."""
+    table_start_xml: str    # <w:tbl> opening tag, tblPr and tblGrid
+    title_row_xml: str
+    header_row_xml: str
+    content_row_xml: str    # One empty content row
+    row_count: int          # Number of content rows
+
+
+def _build_terms_style(config: Config, row_count: int,
+                       term_width_percent: int) -> _TermsStyle:
     """
-    Create a single terms and definitions table.
+    Render the terms and definitions table fragments from config.
 
     Structure:
     - Title row: "Terms and Definitions"
@@ -64,28 +82,18 @@ def _create_terms_table(document: Document, config: Config,
     - Content rows: Empty two-column cells for user entries
 
     Args:
-        document: The Word document.
         config: Configuration settings.
         row_count: Number of content rows.
         term_width_percent: Width of term column as percentage.
-    """
-    # Create table: title row + header row + content rows, two columns
-    total_rows = 2 + row_count  # title + header + content
-    table = document.add_table(rows=total_rows, cols=2)
-    table.alignment = WD_TABLE_ALIGNMENT.CENTER
-    table.autofit = False
-
-    # Set fixed table layout
-    _set_table_layout_fixed(table)
 
+    Returns:
+        _TermsStyle with every table fragment rendered.
+    """
     # Calculate column widths
     total_width_twips = get_content_width_twips(config)
     term_col_width = int(total_width_twips * term_width_percent / 100)
     definition_col_width = total_width_twips - term_col_width
 
-    # Set table grid column widths
-    _set_table_grid(table, [term_col_width, definition_col_width])
-
     # Get row heights from config
     title_row_height_twips = get_title_row_height_twips(config)
     header_row_height_twips = get_header_row_height_twips(config)
@@ -101,266 +109,159 @@ def _create_terms_table(document: Document, config: Config,
 
     # Get styling from config
     title_bg_hex = grayscale_to_hex(config.table.title_row.background_grayscale)
-    title_font_rgb = grayscale_to_rgb(config.table.title_row.font_grayscale)
-    title_font_color = RGBColor(*title_font_rgb)
-    title_font_size = Pt(config.table.title_row.font_size)
+    title_rpr = _run_props_xml(config.table.title_row.font_size,
+                               config.table.title_row.font_grayscale)
 
     header_bg_hex = grayscale_to_hex(config.table.header_row.background_grayscale)
-    header_font_rgb = grayscale_to_rgb(config.table.header_row.font_grayscale)
-    header_font_color = RGBColor(*header_font_rgb)
-    header_font_size = Pt(config.table.header_row.font_size)
-
-    # === TITLE ROW ===
-    title_row = table.rows[0]
-    _set_row_height(title_row, title_row_height_twips)
-
-    # Merge title row cells
-    title_row.cells[0].merge(title_row.cells[1])
-    title_cell = title_row.cells[0]
-    _set_cell_width(title_cell, total_width_twips)
-
-    # Title cell: "Terms and Definitions"
-    _set_cell_shading(title_cell, title_bg_hex)
-    _set_cell_vertical_alignment(title_cell, "center")
-    _add_cell_text(title_cell, "Terms and Definitions", size=title_font_size,
-                   bold=True, color=title_font_color, align=None)
-
-    # === HEADER ROW ===
-    header_row = table.rows[1]
-    _set_row_height(header_row, header_row_height_twips)
-
-    # Term column header
-    term_header_cell = header_row.cells[0]
-    _set_cell_width(term_header_cell, term_col_width)
-    _set_cell_shading(term_header_cell, header_bg_hex)
-    _set_cell_vertical_alignment(term_header_cell, "center")
-    _add_cell_text(term_header_cell, "Term / Abbreviation", size=header_font_size,
-                   bold=True, color=header_font_color, align=None)
-
-    # Definition column header
-    def_header_cell = header_row.cells[1]
-    _set_cell_width(def_header_cell, definition_col_width)
-    _set_cell_shading(def_header_cell, header_bg_hex)
-    _set_cell_vertical_alignment(def_header_cell, "center")
-    _add_cell_text(def_header_cell, "Definition", size=header_font_size,
-                   bold=True, color=header_font_color, align=None)
-
-    # === CONTENT ROWS ===
-    for row_idx in range(row_count):
-        row = table.rows[row_idx + 2]  # +2 to skip title and header rows
-        _set_row_height(row, content_row_height_twips)
-
-        # Term cell
-        term_cell = row.cells[0]
-        _set_cell_width(term_cell, term_col_width)
-        _set_cell_vertical_alignment(term_cell, "center")
-        # Leave cell empty for user to fill in
-
-        # Definition cell
-        def_cell = row.cells[1]
-        _set_cell_width(def_cell, definition_col_width)
-        _set_cell_vertical_alignment(def_cell, "center")
-        # Leave cell empty for user to fill in
-
-    # Apply borders using config settings
-    _set_table_borders(table, config)
-
-
-def _set_table_layout_fixed(table) -> None:
-    """
-    Set table layout to fixed.
+    header_rpr = _run_props_xml(config.table.header_row.font_size,
+                                config.table.header_row.font_grayscale)
+
+    table_start_xml = (
+        '<w:tbl xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+        + _table_props_xml(config)
+        + f'<w:tblGrid><w:gridCol w:w="{term_col_width}"/>'
+        f'<w:gridCol w:w="{definition_col_width}"/></w:tblGrid>'
+    )
 
-    Args:
-        table: The table to set layout on.
-    """
-    tbl = table._tbl
-    tbl_pr = tbl.tblPr
-    if tbl_pr is None:
-        tbl_pr = parse_xml(
-            r'<w:tblPr xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"/>'
-        )
-        tbl.insert(0, tbl_pr)
-
-    tbl_layout = parse_xml(
-        '<w:tblLayout xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" '
-        'w:type="fixed"/>'
+    return _TermsStyle(
+        table_start_xml=table_start_xml,
+        # Title row: single cell spanning both columns
+        title_row_xml=_row_xml(title_row_height_twips, _cell_xml(
+            total_width_twips, "Terms and Definitions", title_bg_hex, title_rpr, grid_span=2
+        )),
+        header_row_xml=_row_xml(
+            header_row_height_twips,
+            _cell_xml(term_col_width, "Term / Abbreviation", header_bg_hex, header_rpr)
+            + _cell_xml(definition_col_width, "Definition", header_bg_hex, header_rpr)
+        ),
+        # Content row: cells left empty for user to fill in, with widths
+        # taken from the table grid (the table layout is fixed)
+        content_row_xml=_row_xml(content_row_height_twips, _cell_xml() * 2),
+        row_count=row_count
     )
-    tbl_pr.append(tbl_layout)
 
 
-def _set_table_grid(table, col_widths: list[int]) -> None:
+def _terms_table_xml(style: _TermsStyle) -> str:
     """
-    Set the table grid column widths.
+    Assemble the complete terms and definitions table XML.
 
     Args:
-        table: The table to set grid on.
-        col_widths: List of column widths in dxa (twips).
-    """
-    tbl = table._tbl
-
-    # Remove existing grid if any
-    existing_grid = tbl.find(qn('w:tblGrid'))
-    if existing_grid is not None:
-        tbl.remove(existing_grid)
-
-    # Create new grid
-    grid_xml = '<w:tblGrid xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
-    for width in col_widths:
-        grid_xml += f'<w:gridCol w:w="{width}"/>'
-    grid_xml += '</w:tblGrid>'
-
-    tbl_grid = parse_xml(grid_xml)
+        style: Pre-rendered table fragments.
 
-    # Insert after tblPr
-    tbl_pr = tbl.tblPr
-    if tbl_pr is not None:
-        tbl_pr.addnext(tbl_grid)
-    else:
-        tbl.insert(0, tbl_grid)
+    Returns:
+        Serialized ``w:tbl`` element.
+    """
+    # Every content row is identical, so the row is repeated
+    return (
+        style.table_start_xml
+        + style.title_row_xml
+        + style.header_row_xml
+        + style.content_row_xml * style.row_count
+        + '</w:tbl>'
+    )
 
 
-def _set_row_height(row, height_twips: int, exact: bool = True) -> None:
+def _create_terms_table(body_sect_pr, table_template) -> None:
     """
-    Set the row height in twips.
+    Create a single terms and definitions table.
+
+    Inserts a copy of the parsed table template as raw OXML, rather than
+    creating the table with python-docx (and its Table wrapper) and styling
+    it cell by cell.
 
     Args:
-        row: The table row.
-        height_twips: Height in twips (dxa).
-        exact: If True, row height is exactly the specified value (won't grow).
-               If False, row height is at least the specified value (can grow).
+        body_sect_pr: The document body's final <w:sectPr> element.
+        table_template: Parsed <w:tbl> element from _terms_table_xml.
     """
-    tr = row._tr
-    tr_pr = tr.get_or_add_trPr()
-
-    # Remove existing height if any
-    existing_height = tr_pr.find(qn('w:trHeight'))
-    if existing_height is not None:
-        tr_pr.remove(existing_height)
-
-    h_rule = "exact" if exact else "atLeast"
-    tr_height = parse_xml(
-        f'<w:trHeight xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" '
-        f'w:val="{height_twips}" w:hRule="{h_rule}"/>'
-    )
-    tr_pr.append(tr_height)
+    append_table(body_sect_pr, deepcopy(table_template))
 
 
-def _set_cell_width(cell, width_dxa: int) -> None:
+def _table_props_xml(config: Config) -> str:
     """
-    Set cell width in dxa (twips).
+    Build the complete table properties: centered, fixed layout, bordered.
+
+    Layout and borders go into one ``w:tblPr`` rather than being appended
+    to a python-docx table by separate helpers.
 
     Args:
-        cell: The table cell.
-        width_dxa: Width in dxa.
-    """
-    tc = cell._tc
-    tc_pr = tc.get_or_add_tcPr()
+        config: Configuration with border settings.
 
-    # Remove existing width if any
-    existing_width = tc_pr.find(qn('w:tcW'))
-    if existing_width is not None:
-        tc_pr.remove(existing_width)
+    Returns:
+        Serialized ``w:tblPr`` element (without namespace declaration).
+    """
+    # Get border settings from config
+    border_color_hex = grayscale_to_hex(config.table.border.grayscale)
+    border_size = int(config.table.border.thickness * 8)  # Eighths of a point
 
-    tc_w = parse_xml(
-        f'<w:tcW xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" '
-        f'w:w="{width_dxa}" w:type="dxa"/>'
+    border = f'w:val="single" w:sz="{border_size}" w:color="{border_color_hex}"'
+    return (
+        '<w:tblPr><w:tblW w:w="0" w:type="auto"/><w:jc w:val="center"/>'
+        '<w:tblLayout w:type="fixed"/>'
+        '<w:tblLook w:val="04A0" w:firstRow="1" w:lastRow="0" w:firstColumn="1" '
+        'w:lastColumn="0" w:noHBand="0" w:noVBand="1"/>'
+        f'<w:tblBorders><w:top {border}/><w:left {border}/><w:bottom {border}/>'
+        f'<w:right {border}/><w:insideH {border}/><w:insideV {border}/></w:tblBorders>'
+        '</w:tblPr>'
     )
-    tc_pr.insert(0, tc_w)
 
 
-def _set_cell_vertical_alignment(cell, alignment: str) -> None:
+def _run_props_xml(font_size_pt: float, font_grayscale: int) -> str:
     """
-    Set vertical alignment of a cell.
+    Build bold run properties for title and header text.
 
     Args:
-        cell: The table cell.
-        alignment: Alignment value ("top", "center", "bottom").
-    """
-    tc = cell._tc
-    tc_pr = tc.get_or_add_tcPr()
-
-    # Remove existing vAlign if any
-    existing_valign = tc_pr.find(qn('w:vAlign'))
-    if existing_valign is not None:
-        tc_pr.remove(existing_valign)
+        font_size_pt: Font size in points.
+        font_grayscale: Font color (0=white, 100=black).
 
-    v_align = parse_xml(
-        f'<w:vAlign xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" '
-        f'w:val="{alignment}"/>'
+    Returns:
+        Serialized ``w:rPr`` element (without namespace declaration).
+    """
+    return (
+        f'<w:rPr><w:rFonts w:ascii="{FONT_NAME}" w:hAnsi="{FONT_NAME}"/><w:b/>'
+        f'<w:color w:val="{grayscale_to_hex(font_grayscale)}"/>'
+        f'<w:sz w:val="{int(font_size_pt * 2)}"/>'  # Half-points
+        f'</w:rPr>'
     )
-    tc_pr.append(v_align)
 
 
-def _set_cell_shading(cell, color_hex: str) -> None:
+def _row_xml(height_twips: int, cells_xml: str) -> str:
     """
-    Set the background shading color of a cell.
+    Build a table row with an exact height.
 
     Args:
-        cell: The table cell.
-        color_hex: Hex color string (e.g., "000000" for black).
+        height_twips: Row height in twips (dxa).
+        cells_xml: Serialized ``w:tc`` elements for the row.
+
+    Returns:
+        Serialized ``w:tr`` element (without namespace declaration).
     """
-    tc = cell._tc
-    tc_pr = tc.get_or_add_tcPr()
-    shd = parse_xml(
-        f'<w:shd xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" '
-        f'w:val="clear" w:color="auto" w:fill="{color_hex}"/>'
+    return (
+        f'<w:tr><w:trPr><w:trHeight w:val="{height_twips}" w:hRule="exact"/></w:trPr>'
+        f'{cells_xml}</w:tr>'
     )
-    tc_pr.append(shd)
 
 
-def _add_cell_text(cell, text: str, size=None, bold: bool = False,
-                   color=COLOR_BLACK, align=None) -> None:
+def _cell_xml(width_dxa: int = None, text: str = "", bg_hex: str = None,
+              rpr_xml: str = "", grid_span: int = 1) -> str:
     """
-    Add formatted text to a table cell.
+    Build a vertically centered table cell.
 
     Args:
-        cell: The table cell.
-        text: The text to add.
-        size: Font size (None to inherit from document default).
-        bold: Whether to make the text bold.
-        color: Font color (RGBColor).
-        align: Paragraph alignment (None for default LEFT).
-    """
-    para = cell.paragraphs[0]
-    if align is not None:
-        para.alignment = align
-    run = para.add_run(text)
-    run.font.name = FONT_NAME
-    if size is not None:
-        run.font.size = size
-    if bold:
-        run.font.bold = bold
-    run.font.color.rgb = color
-
-
-def _set_table_borders(table, config: Config) -> None:
+        width_dxa: Cell width in dxa (twips), or None to take the width from
+                   the table grid.
+        text: Cell text. Empty cells get a bare paragraph.
+        bg_hex: Background fill color, or None for no shading.
+        rpr_xml: Run properties XML for the cell text.
+        grid_span: Number of grid columns the cell spans.
+
+    Returns:
+        Serialized ``w:tc`` element (without namespace declaration).
     """
-    Set table borders using config settings.
-
-    Args:
-        table: The table to set borders on.
-        config: Configuration with border settings.
-    """
-    # Get border settings from config
-    border_color_hex = grayscale_to_hex(config.table.border.grayscale)
-    border_size = int(config.table.border.thickness * 8)  # Eighths of a point
-
-    tbl = table._tbl
-    tbl_pr = tbl.tblPr if tbl.tblPr is not None else parse_xml(
-        r'<w:tblPr xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"/>'
+    cell_width = f'<w:tcW w:w="{width_dxa}" w:type="dxa"/>' if width_dxa is not None else ''
+    span = f'<w:gridSpan w:val="{grid_span}"/>' if grid_span > 1 else ''
+    shading = f'<w:shd w:val="clear" w:color="auto" w:fill="{bg_hex}"/>' if bg_hex else ''
+    para = f'<w:p><w:r>{rpr_xml}<w:t>{text}</w:t></w:r></w:p>' if text else '<w:p/>'
+    return (
+        f'<w:tc><w:tcPr>{cell_width}{span}{shading}'
+        f'<w:vAlign w:val="center"/></w:tcPr>{para}</w:tc>'
     )
-
-    tbl_borders = parse_xml(
-        f'''<w:tblBorders xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">
-            <w:top w:val="single" w:sz="{border_size}" w:color="{border_color_hex}"/>
-            <w:left w:val="single" w:sz="{border_size}" w:color="{border_color_hex}"/>
-            <w:bottom w:val="single" w:sz="{border_size}" w:color="{border_color_hex}"/>
-            <w:right w:val="single" w:sz="{border_size}" w:color="{border_color_hex}"/>
-            <w:insideH w:val="single" w:sz="{border_size}" w:color="{border_color_hex}"/>
-            <w:insideV w:val="single" w:sz="{border_size}" w:color="{border_color_hex}"/>
-        </w:tblBorders>'''
-    )
-
-    tbl_pr.append(tbl_borders)
-    if tbl.tblPr is None:
-        tbl.insert(0, tbl_pr)
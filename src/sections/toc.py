@@ -6,22 +6,23 @@ Pre-calculates page numbers for all content sections.
 """
 
 import calendar
-from dataclasses import dataclass
+from array import array
+from dataclasses import dataclass, field
 from datetime import date
+from xml.sax.saxutils import escape
+
 from docx import Document
-from docx.shared import Pt, RGBColor
-from docx.enum.text import WD_ALIGN_PARAGRAPH
-from docx.enum.table import WD_TABLE_ALIGNMENT
-from docx.oxml.ns import qn
-from docx.oxml import parse_xml
+from docx.shared import Pt
 
 from src.config import Config
 from src.document import (
     add_page_break, add_config_info_overlay, get_content_width_twips,
     compute_table_row_height, MINIMIZED_PARAGRAPH_HEIGHT_TWIPS,
-    get_title_row_height_twips, grayscale_to_hex, grayscale_to_rgb
+    get_title_row_height_twips, grayscale_to_hex
 )
+from src.utils.dates import ORDINAL_SUFFIXES
 from src.utils.styles import FONT_NAME, COLOR_BLACK
+from src.utils.tables import append_table_xml, get_body_sect_pr
 
 
 # Month names
@@ -33,13 +34,50 @@ MONTH_NAMES = [
 # Day names
 DAY_NAMES = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
 
+# Content row font size in points
+CONTENT_FONT_SIZE_PT = 10
+
+# Shared lengths for the blank verso paragraph
+_PT_0 = Pt(0)
+_PT_1 = Pt(1)
 
-@dataclass
-class TOCEntry:
-    """A single entry in the Table of Contents."""
-    label: str           # Description text (e.g., "Goals", "January 1st, Thursday")
-    page_number: int     # Logical page number
-    shading_level: int = 0  # 0=none, 1=section header, 2=first item marker
+# Content row paragraphs: the label and page number runs share the same
+# run properties and differ only in alignment. The text goes in between.
+_CONTENT_RPR_XML = (
+    f'<w:rPr><w:rFonts w:ascii="{FONT_NAME}" w:hAnsi="{FONT_NAME}"/>'
+    f'<w:color w:val="{COLOR_BLACK}"/>'
+    f'<w:sz w:val="{CONTENT_FONT_SIZE_PT * 2}"/></w:rPr>'  # Half-points
+)
+_LABEL_TEXT_OPEN = f'<w:p><w:pPr><w:jc w:val="left"/></w:pPr><w:r>{_CONTENT_RPR_XML}<w:t>'
+_PAGE_TEXT_OPEN = f'<w:p><w:pPr><w:jc w:val="right"/></w:pPr><w:r>{_CONTENT_RPR_XML}<w:t>'
+_TEXT_CLOSE = '</w:t></w:r></w:p></w:tc>'
+
+
+@dataclass(slots=True)
+class TOCEntries:
+    """
+    All Table of Contents entries, stored column by column.
+
+    Entry i is (labels[i], page_numbers[i], shading_levels[i]).
+    """
+    # Description text (e.g., "Goals", "January 1st, Thursday")
+    labels: list[str] = field(default_factory=list)
+    # Logical page numbers
+    page_numbers: array = field(default_factory=lambda: array('i'))
+    # 0=none, 1=section header, 2=first item marker
+    shading_levels: bytearray = field(default_factory=bytearray)
+    # Length of the longest label
+    max_label_len: int = 0
+
+
+@dataclass(frozen=True, slots=True)
+class _TOCStyle:
+    """Pre-rendered XML fragments shared by every TOC table."""
+    table_start_xml: str            # <w:tbl> opening tag, tblPr, tblGrid and title row
+    row_start_xml: str              # <w:tr> opening tag and row properties
+    label_tc_xml: tuple[str, ...]   # Label cell opening tag and tcPr, by shading level
+    entry_tc_xml: tuple[str, ...]   # Complete blank user entry cell, by shading level
+    page_tc_xml: tuple[str, ...]    # Page number cell opening tag and tcPr, by shading level
 
 
 def generate_toc(document: Document, config: Config) -> None:
@@ -60,12 +98,16 @@ def generate_toc(document: Document, config: Config) -> None:
     # Build all TOC entries
     entries = _build_toc_entries(config)
 
-    # Calculate column widths once for all tables (consistency across pages)
-    col_widths = _calculate_column_widths(entries, config)
+    # Calculate column widths and table styling once for all tables
+    # (consistency across pages). Page numbers ascend, so the last is largest
+    col_widths = _calculate_column_widths(entries.max_label_len,
+                                          entries.page_numbers[-1], config)
+    style = _build_toc_style(config, rows_per_page, col_widths)
 
     # Generate TOC pages
-    total_entries = len(entries)
+    total_entries = len(entries.labels)
     page_idx = 0
+    body_sect_pr = get_body_sect_pr(document)
 
     for start_idx in range(0, total_entries, rows_per_page):
         # Add page break between TOC pages (not before first)
@@ -73,12 +115,14 @@ def generate_toc(document: Document, config: Config) -> None:
             add_page_break(document, minimize_height=True)
 
         end_idx = min(start_idx + rows_per_page, total_entries)
-        page_entries = entries[start_idx:end_idx]
 
         # Create TOC table for this page
-        # Last page: only create rows for actual entries, but keep same row height
-        is_last_page = (end_idx == total_entries)
-        _create_toc_table(document, config, page_entries, rows_per_page, col_widths, is_last_page)
+        # The last page only gets rows for its actual entries, but keeps the
+        # same row height
+        _create_toc_table(document, body_sect_pr, style,
+                          entries.labels[start_idx:end_idx],
+                          entries.page_numbers[start_idx:end_idx],
+                          entries.shading_levels[start_idx:end_idx])
 
         # Determine if this is recto or verso (TOC starts on recto)
         is_recto = (page_idx % 2 == 0)
@@ -93,33 +137,34 @@ def generate_toc(document: Document, config: Config) -> None:
         # Add minimal paragraph to establish this as a page with body content
         # (overlay alone goes to header/footer, not body)
         blank_para = document.add_paragraph()
-        blank_para.paragraph_format.space_before = Pt(0)
-        blank_para.paragraph_format.space_after = Pt(0)
+        blank_para.paragraph_format.space_before = _PT_0
+        blank_para.paragraph_format.space_after = _PT_0
         # Set minimal font size to minimize any visual impact
         if blank_para.runs:
-            blank_para.runs[0].font.size = Pt(1)
+            blank_para.runs[0].font.size = _PT_1
         add_config_info_overlay(document, config, is_recto=False, anchor_paragraph=blank_para)
 
 
-def _estimate_text_width_twips(text: str, font_size_pt: float) -> int:
+def _estimate_text_width_twips(num_chars: int, font_size_pt: float) -> int:
     """
     Estimate text width in twips based on character count and font size.
 
     Uses average character width approximation for proportional fonts like Arial/Calibri.
 
     Args:
-        text: The text string to measure.
+        num_chars: Number of characters in the text.
         font_size_pt: Font size in points.
 
     Returns:
         Estimated width in twips.
     """
     avg_char_width_pt = font_size_pt * 0.50  # Approximate for Arial/Calibri
-    text_width_pt = len(text) * avg_char_width_pt
+    text_width_pt = num_chars * avg_char_width_pt
     return int(text_width_pt * 20)  # 20 twips per point
 
 
-def _calculate_column_widths(entries: list[TOCEntry], config: Config) -> tuple[int, int, int]:
+def _calculate_column_widths(max_label_len: int, max_page: int,
+                             config: Config) -> tuple[int, int, int]:
     """
     Calculate optimal column widths based on content.
 
@@ -128,25 +173,21 @@ def _calculate_column_widths(entries: list[TOCEntry], config: Config) -> tuple[i
     - User entry column: Remaining space
 
     Args:
-        entries: All TOC entries.
+        max_label_len: Length of the longest entry label.
+        max_page: Largest entry page number.
         config: Configuration with page settings.
 
     Returns:
         Tuple of (label_width, entry_width, page_width) in twips.
     """
     total_width = get_content_width_twips(config)
-    font_size = 10  # Content font size in points
+    font_size = CONTENT_FONT_SIZE_PT
     label_padding_twips = 150  # ~0.26cm padding for label column
     page_padding_twips = 250  # ~0.44cm padding for page number column (needs more room)
 
-    # Find longest label
-    max_label = max((e.label for e in entries), key=len, default="")
-    label_width = _estimate_text_width_twips(max_label, font_size) + label_padding_twips
-
-    # Find largest page number
-    max_page = max(e.page_number for e in entries)
-    page_num_text = str(max_page)
-    page_width = _estimate_text_width_twips(page_num_text, font_size) + page_padding_twips
+    # Longest label and largest page number are tracked by _build_toc_entries
+    label_width = _estimate_text_width_twips(max_label_len, font_size) + label_padding_twips
+    page_width = _estimate_text_width_twips(len(str(max_page)), font_size) + page_padding_twips
 
     # User entry gets remaining space
     entry_width = total_width - label_width - page_width
@@ -154,7 +195,7 @@ def _calculate_column_widths(entries: list[TOCEntry], config: Config) -> tuple[i
     return (label_width, entry_width, page_width)
 
 
-def _build_toc_entries(config: Config) -> list[TOCEntry]:
+def _build_toc_entries(config: Config) -> TOCEntries:
     """
     Build all TOC entries with pre-calculated page numbers.
 
@@ -169,112 +210,127 @@ def _build_toc_entries(config: Config) -> list[TOCEntry]:
         config: Configuration with document settings.
 
     Returns:
-        List of TOCEntry objects for all numbered pages.
+        TOCEntries for all numbered pages, including the longest label
+        length, tracked while building so callers need no extra pass.
     """
-    entries = []
+    entries = TOCEntries()
     current_page = 1
+    max_label_len = 0
     year = config.document.year
 
+    # Bound once, since add() runs for every numbered page and day
+    append_label = entries.labels.append
+    append_page = entries.page_numbers.append
+    append_shading = entries.shading_levels.append
+
+    def add(label: str = "", shading: int = 0, next_page: bool = True) -> None:
+        """Add an entry on the current page, then move to the next page."""
+        nonlocal current_page, max_label_len
+        append_label(label)
+        append_page(current_page)
+        append_shading(shading)
+        if len(label) > max_label_len:
+            max_label_len = len(label)
+        if next_page:
+            current_page += 1
+
     # === GOALS (pages 1-2: recto + blank verso) ===
-    entries.append(TOCEntry("Goals", current_page, shading_level=1))
-    current_page += 1
-    entries.append(TOCEntry("", current_page))  # Blank verso
-    current_page += 1
+    add("Goals", 1)
+    add()  # Blank verso
 
     # === BACKLOG ===
     backlog_pages = config.raw.get('backlog', {}).get('page_count', 4)
     for i in range(backlog_pages):
         shading = 1 if i == 0 else 0  # Level 1 for first page only
-        entries.append(TOCEntry(f"Backlog ({i + 1}/{backlog_pages})", current_page, shading_level=shading))
-        current_page += 1
+        add(f"Backlog ({i + 1}/{backlog_pages})", shading)
 
     # === WEEK PLANNER ===
     weeks = _get_week_count(year)
     rows_per_page = config.raw.get('week_planner', {}).get('rows_per_page', 14)
     week_pages = (weeks + rows_per_page - 1) // rows_per_page  # Ceiling division
 
-    # Get weeks that contain the 1st of each month (for Level 2 shading)
-    first_week_of_months = _get_first_weeks_of_months(year)
+    # Weeks that contain the 1st of each month (for Level 2 shading)
+    first_week_mask = _get_first_weeks_of_months(year)
 
     for i in range(week_pages):
         start_week = i * rows_per_page + 1
         end_week = min((i + 1) * rows_per_page, weeks)
 
-        # Check if any first-week-of-month falls within this page's weeks
-        has_first_week = any(start_week <= w <= end_week for w in first_week_of_months)
+        # Bits start_week..end_week, to test against the first-week mask
+        page_mask = (1 << (end_week + 1)) - (1 << start_week)
 
         if i == 0:
             shading = 1  # First page gets Level 1
-        elif has_first_week:
+        elif first_week_mask & page_mask:
             shading = 2  # Pages with first-week-of-month get Level 2
         else:
             shading = 0
 
-        entries.append(TOCEntry(f"Week Planner (Weeks {start_week}-{end_week})", current_page, shading_level=shading))
-        current_page += 1
+        add(f"Week Planner (Weeks {start_week}-{end_week})", shading)
 
     # === MONTHLY SECTIONS ===
+    # Weekday and ISO week are carried through the year in one sweep with
+    # integer arithmetic, rather than creating a date for every day.
+    # January 1st falls in week 1 if it is a Monday to Thursday, otherwise
+    # in the previous year's last week.
+    weekday = date(year, 1, 1).weekday()
+    week_num = 1 if weekday <= 3 else _get_week_count(year - 1)
+    # Local aliases for the per-day label lookups
+    ordinals = ORDINAL_SUFFIXES
+    day_names = DAY_NAMES
+
     for month_num in range(1, 13):
         month_name = MONTH_NAMES[month_num - 1]
         num_days = calendar.monthrange(year, month_num)[1]
 
         # Month cover (recto) + blank verso - Level 1 shading for cover
-        entries.append(TOCEntry(f"{month_name}", current_page, shading_level=1))
-        current_page += 1
-        entries.append(TOCEntry("", current_page))  # Blank verso
-        current_page += 1
+        add(month_name, 1)
+        add()  # Blank verso
 
         # Daily spread pages (2 tables per page side)
-        days = [date(year, month_num, day) for day in range(1, num_days + 1)]
-        day_idx = 0
-
-        while day_idx < len(days):
-            # First day on this page
-            day1 = days[day_idx]
-            label1 = _format_day_label(day1)
-            # Level 2 shading for Saturday (5) and Sunday (6)
-            shading1 = 2 if day1.weekday() in (5, 6) else 0
-            entries.append(TOCEntry(label1, current_page, shading_level=shading1))
-            day_idx += 1
-
-            # Second day on this page (if exists)
-            if day_idx < len(days):
-                day2 = days[day_idx]
-                label2 = _format_day_label(day2)
-                # Level 2 shading for Saturday (5) and Sunday (6)
-                shading2 = 2 if day2.weekday() in (5, 6) else 0
-                entries.append(TOCEntry(label2, current_page, shading_level=shading2))
-                day_idx += 1
-
-            current_page += 1
+        # Format: "Week N, Month Nth, Day" (e.g., "Week 1, January 1st, Thursday")
+        for day in range(1, num_days + 1):
+            # A new ISO week starts on Monday (January 1st already has its
+            # week). It is week 1 again when January 1st was in the previous
+            # year's last week, or when the week's Thursday falls in the next
+            # year (Monday 29th-31st December).
+            if weekday == 0 and (month_num, day) != (1, 1):
+                if (month_num == 1 and week_num >= 52) or (month_num == 12 and day >= 29):
+                    week_num = 1
+                else:
+                    week_num += 1
+
+            # Level 2 shading for Saturday (5) and Sunday (6). Move to the
+            # next page side after every second day (and the month's last day)
+            add(f"Week {week_num}, {month_name} {day}{ordinals[day]}, {day_names[weekday]}",
+                2 if weekday >= 5 else 0,
+                next_page=(day % 2 == 0 or day == num_days))
+            weekday = (weekday + 1) % 7
 
         # Daily spread always ends on verso, check if we need blank verso
         num_page_sides = (num_days + 1) // 2
         if num_page_sides % 2 == 1:
             # Ended on recto, blank verso was added
-            entries.append(TOCEntry("", current_page))
-            current_page += 1
+            add()
 
     # === TERMS AND DEFINITIONS ===
     td_pages = config.raw.get('terms_definitions', {}).get('page_count', 4)
     for i in range(td_pages):
         shading = 1 if i == 0 else 0  # Level 1 for first page only
-        entries.append(TOCEntry(f"Terms and Definitions ({i + 1}/{td_pages})", current_page, shading_level=shading))
-        current_page += 1
+        add(f"Terms and Definitions ({i + 1}/{td_pages})", shading)
 
     # === GRAPH PAPER ===
     graph_pages = config.raw.get('graph_paper', {}).get('page_count', 8)
     for i in range(graph_pages):
         shading = 1 if i == 0 else 0  # Level 1 for first page only
-        entries.append(TOCEntry(f"Graph Paper ({i + 1}/{graph_pages})", current_page, shading_level=shading))
-        current_page += 1
-        entries.append(TOCEntry("", current_page))  # Blank verso
-        current_page += 1
+        add(f"Graph Paper ({i + 1}/{graph_pages})", shading)
+        add()  # Blank verso
 
+    entries.max_label_len = max_label_len
     return entries
 
 
-def _get_first_weeks_of_months(year: int) -> set[int]:
+def _get_first_weeks_of_months(year: int) -> int:
     """
     Get the ISO week numbers that contain the 1st day of each month.
 
@@ -282,13 +338,13 @@ def _get_first_weeks_of_months(year: int) -> set[int]:
         year: The year.
 
     Returns:
-        Set of ISO week numbers (1-53) that contain a month's first day.
+        Bit mask with bit N set for each ISO week N (1-53) that contains a
+        month's first day, so a range of weeks is tested with a single AND.
     """
-    first_weeks = set()
+    first_weeks = 0
     for month in range(1, 13):
-        first_day = date(year, month, 1)
-        iso_week = first_day.isocalendar()[1]
-        first_weeks.add(iso_week)
+        iso_week = date(year, month, 1).isocalendar()[1]
+        first_weeks |= 1 << iso_week
     return first_weeks
 
 
@@ -315,66 +371,22 @@ def _get_week_count(year: int) -> int:
     return 52
 
 
-def _format_day_label(day: date) -> str:
+def _build_toc_style(config: Config, rows_per_page: int,
+                     col_widths: tuple[int, int, int]) -> _TOCStyle:
     """
-    Format a day for the TOC entry.
-
-    Format: "Week N, Month Nth, Day" (e.g., "Week 1, January 1st, Thursday")
+    Render the XML fragments shared by every TOC table once.
 
     Args:
-        day: The date.
-
-    Returns:
-        Formatted label string.
-    """
-    week_num = day.isocalendar()[1]
-    month_name = MONTH_NAMES[day.month - 1]
-    day_name = DAY_NAMES[day.weekday()]
-    ordinal = _get_ordinal_suffix(day.day)
-    return f"Week {week_num}, {month_name} {day.day}{ordinal}, {day_name}"
-
-
-def _get_ordinal_suffix(n: int) -> str:
-    """Get ordinal suffix for a number (st, nd, rd, th)."""
-    if 11 <= n <= 13:
-        return "th"
-    return {1: "st", 2: "nd", 3: "rd"}.get(n % 10, "th")
-
-
-def _create_toc_table(document: Document, config: Config,
-                      entries: list[TOCEntry], rows_per_page: int,
-                      col_widths: tuple[int, int, int],
-                      is_last_page: bool = False) -> None:
-    """
-    Create a TOC table for one page.
-
-    Structure:
-    - Title row: "Table of Contents" spanning all columns
-    - Content rows: Page Label | User Entry | Page Number
-
-    Args:
-        document: The Word document.
         config: Configuration settings.
-        entries: TOC entries for this page.
         rows_per_page: Number of content rows per page (used for row height calculation).
         col_widths: Tuple of (label_width, entry_width, page_width) in twips.
-        is_last_page: If True, only create rows for actual entries (no empty rows).
+
+    Returns:
+        Pre-rendered table fragments.
     """
     label_width, entry_width, page_width = col_widths
     total_width_twips = get_content_width_twips(config)
 
-    # Create table: title row + content rows
-    # On last page, only create rows for actual entries (no empty rows)
-    actual_content_rows = len(entries) if is_last_page else rows_per_page
-    total_rows = 1 + actual_content_rows
-    table = document.add_table(rows=total_rows, cols=3)
-    table.alignment = WD_TABLE_ALIGNMENT.CENTER
-    table.autofit = False
-
-    # Set fixed table layout
-    _set_table_layout_fixed(table)
-    _set_table_grid(table, list(col_widths))
-
     # Get row heights
     title_row_height_twips = get_title_row_height_twips(config)
 
@@ -387,219 +399,147 @@ def _create_toc_table(document: Document, config: Config,
         preceding_paragraph_height_twips=MINIMIZED_PARAGRAPH_HEIGHT_TWIPS
     )
 
-    # Get title row styling from config
-    title_bg_hex = grayscale_to_hex(config.table.title_row.background_grayscale)
-    title_font_rgb = grayscale_to_rgb(config.table.title_row.font_grayscale)
-    title_font_color = RGBColor(*title_font_rgb)
-    title_font_size = Pt(config.table.title_row.font_size)
-
-    # Get TOC shading config
+    # Get TOC shading config, as fill colors indexed by shading level
+    # (0=none, 1=section header, 2=first item marker)
     toc_config = config.raw.get('toc', {})
-    section_grayscale = toc_config.get('section_grayscale', 15)
-    first_item_grayscale = toc_config.get('first_item_grayscale', 5)
-
-    # === TITLE ROW ===
-    title_row = table.rows[0]
-    _set_row_height(title_row, title_row_height_twips)
-
-    # Merge all cells in title row
-    title_cell = title_row.cells[0]
-    for i in range(1, 3):
-        title_cell.merge(title_row.cells[i])
-
-    _set_cell_width(title_cell, total_width_twips)
-    _set_cell_shading(title_cell, title_bg_hex)
-    _set_cell_vertical_alignment(title_cell, "center")
-    _add_cell_text(title_cell, "Table of Contents", size=title_font_size,
-                   bold=True, color=title_font_color, align=None)
-
-    # === CONTENT ROWS ===
-    # On last page, we only have actual_content_rows (no empty rows)
-    # Row height is still based on rows_per_page for consistency
-    for row_idx in range(actual_content_rows):
-        row = table.rows[row_idx + 1]
-        _set_row_height(row, content_row_height_twips)
-
-        # Get entry for this row
-        entry = entries[row_idx]
-        label_text = entry.label
-        page_text = str(entry.page_number)  # Always show page number
-        shading_level = entry.shading_level
-
-        # Label cell (left-aligned)
-        label_cell = row.cells[0]
-        _set_cell_width(label_cell, label_width)
-        _set_cell_vertical_alignment(label_cell, "center")
-        if label_text:
-            _add_cell_text(label_cell, label_text, size=Pt(10), bold=False,
-                           color=COLOR_BLACK, align=WD_ALIGN_PARAGRAPH.LEFT)
-
-        # User entry cell (blank)
-        entry_cell = row.cells[1]
-        _set_cell_width(entry_cell, entry_width)
-        _set_cell_vertical_alignment(entry_cell, "center")
-
-        # Page number cell (right-aligned)
-        page_cell = row.cells[2]
-        _set_cell_width(page_cell, page_width)
-        _set_cell_vertical_alignment(page_cell, "center")
-        if page_text:
-            _add_cell_text(page_cell, page_text, size=Pt(10), bold=False,
-                           color=COLOR_BLACK, align=WD_ALIGN_PARAGRAPH.RIGHT)
-
-        # Apply shading based on level
-        if shading_level == 1:
-            shading_hex = grayscale_to_hex(section_grayscale)
-            _set_cell_shading(label_cell, shading_hex)
-            _set_cell_shading(entry_cell, shading_hex)
-            _set_cell_shading(page_cell, shading_hex)
-        elif shading_level == 2:
-            shading_hex = grayscale_to_hex(first_item_grayscale)
-            _set_cell_shading(label_cell, shading_hex)
-            _set_cell_shading(entry_cell, shading_hex)
-            _set_cell_shading(page_cell, shading_hex)
-
-    # Apply borders
-    _set_table_borders(table, config)
-
-
-# === Table Helper Functions ===
-
-def _set_table_layout_fixed(table) -> None:
-    """Set table layout to fixed."""
-    tbl = table._tbl
-    tbl_pr = tbl.tblPr
-    if tbl_pr is None:
-        tbl_pr = parse_xml(
-            r'<w:tblPr xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"/>'
-        )
-        tbl.insert(0, tbl_pr)
-
-    tbl_layout = parse_xml(
-        '<w:tblLayout xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" '
-        'w:type="fixed"/>'
+    shading_hexes = (
+        None,
+        grayscale_to_hex(toc_config.get('section_grayscale', 15)),
+        grayscale_to_hex(toc_config.get('first_item_grayscale', 5))
     )
-    tbl_pr.append(tbl_layout)
 
+    # Title row: single cell spanning all three columns, so no merge is needed
+    title_config = config.table.title_row
+    title_row_xml = (
+        _row_start_xml(title_row_height_twips)
+        + '<w:tc><w:tcPr>'
+        f'<w:tcW w:w="{total_width_twips}" w:type="dxa"/><w:gridSpan w:val="3"/>'
+        + _shading_xml(grayscale_to_hex(title_config.background_grayscale))
+        + '<w:vAlign w:val="center"/></w:tcPr>'
+        f'<w:p><w:r><w:rPr><w:rFonts w:ascii="{FONT_NAME}" w:hAnsi="{FONT_NAME}"/><w:b/>'
+        f'<w:color w:val="{grayscale_to_hex(title_config.font_grayscale)}"/>'
+        f'<w:sz w:val="{int(title_config.font_size * 2)}"/></w:rPr>'  # Half-points
+        '<w:t>Table of Contents</w:t></w:r></w:p></w:tc></w:tr>'
+    )
 
-def _set_table_grid(table, col_widths: list[int]) -> None:
-    """Set the table grid column widths."""
-    tbl = table._tbl
+    grid_cols = ''.join(f'<w:gridCol w:w="{width}"/>' for width in col_widths)
+    table_start_xml = (
+        '<w:tbl xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+        + _table_props_xml(config)
+        + f'<w:tblGrid>{grid_cols}</w:tblGrid>'
+        + title_row_xml
+    )
 
-    existing_grid = tbl.find(qn('w:tblGrid'))
-    if existing_grid is not None:
-        tbl.remove(existing_grid)
+    return _TOCStyle(
+        table_start_xml=table_start_xml,
+        row_start_xml=_row_start_xml(content_row_height_twips),
+        label_tc_xml=tuple(_tc_start_xml(label_width, bg) for bg in shading_hexes),
+        entry_tc_xml=tuple(_tc_start_xml(entry_width, bg) + '<w:p/></w:tc>'
+                           for bg in shading_hexes),
+        page_tc_xml=tuple(_tc_start_xml(page_width, bg) for bg in shading_hexes)
+    )
 
-    grid_xml = '<w:tblGrid xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
-    for width in col_widths:
-        grid_xml += f'<w:gridCol w:w="{width}"/>'
-    grid_xml += '</w:tblGrid>'
 
-    tbl_grid = parse_xml(grid_xml)
+def _create_toc_table(document: Document, body_sect_pr, style: _TOCStyle,
+                      labels: list[str], page_numbers: array,
+                      shading_levels: bytearray) -> None:
+    """
+    Create a TOC table for one page.
 
-    tbl_pr = tbl.tblPr
-    if tbl_pr is not None:
-        tbl_pr.addnext(tbl_grid)
-    else:
-        tbl.insert(0, tbl_grid)
+    Structure:
+    - Title row: "Table of Contents" spanning all columns
+    - Content rows: Page Label | User Entry | Page Number
 
+    The whole ``w:tbl`` is assembled as one XML string from the
+    pre-rendered fragments and parsed once, rather than created with
+    document.add_table and filled in cell by cell. One content row is
+    created per entry, so a short last page has no empty rows (row height
+    is still based on rows_per_page).
 
-def _set_row_height(row, height_twips: int, exact: bool = True) -> None:
-    """Set the row height in twips."""
-    tr = row._tr
-    tr_pr = tr.get_or_add_trPr()
+    Args:
+        document: The Word document.
+        body_sect_pr: The document body's final <w:sectPr> element.
+        style: Pre-rendered table fragments from _build_toc_style.
+        labels: Entry labels for this page.
+        page_numbers: Entry page numbers for this page.
+        shading_levels: Entry shading levels for this page.
+    """
+    row_start_xml = style.row_start_xml
+    label_tc_xml = style.label_tc_xml
+    entry_tc_xml = style.entry_tc_xml
+    page_tc_xml = style.page_tc_xml
+
+    parts = [style.table_start_xml]
+    for label, page_number, level in zip(labels, page_numbers, shading_levels):
+        # Shading is applied based on level; the page number is always shown
+        label_xml = f'{_LABEL_TEXT_OPEN}{escape(label)}{_TEXT_CLOSE}' if label else '<w:p/></w:tc>'
+        parts.append(
+            f'{row_start_xml}{label_tc_xml[level]}{label_xml}{entry_tc_xml[level]}'
+            f'{page_tc_xml[level]}{_PAGE_TEXT_OPEN}{page_number}{_TEXT_CLOSE}</w:tr>'
+        )
+    parts.append('</w:tbl>')
 
-    existing_height = tr_pr.find(qn('w:trHeight'))
-    if existing_height is not None:
-        tr_pr.remove(existing_height)
+    append_table_xml(document, ''.join(parts), body_sect_pr)
 
-    h_rule = "exact" if exact else "atLeast"
-    tr_height = parse_xml(
-        f'<w:trHeight xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" '
-        f'w:val="{height_twips}" w:hRule="{h_rule}"/>'
-    )
-    tr_pr.append(tr_height)
 
+# === Table XML Helper Functions ===
 
-def _set_cell_width(cell, width_dxa: int) -> None:
-    """Set cell width in dxa (twips)."""
-    tc = cell._tc
-    tc_pr = tc.get_or_add_tcPr()
+def _table_props_xml(config: Config) -> str:
+    """
+    Build the complete table properties: centered, fixed layout, bordered.
 
-    existing_width = tc_pr.find(qn('w:tcW'))
-    if existing_width is not None:
-        tc_pr.remove(existing_width)
+    Args:
+        config: Configuration with border settings.
 
-    tc_w = parse_xml(
-        f'<w:tcW xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" '
-        f'w:w="{width_dxa}" w:type="dxa"/>'
+    Returns:
+        Serialized ``w:tblPr`` element (without namespace declaration).
+    """
+    # Get border settings from config
+    border_color_hex = grayscale_to_hex(config.table.border.grayscale)
+    border_size = int(config.table.border.thickness * 8)  # Eighths of a point
+
+    border = f'w:val="single" w:sz="{border_size}" w:color="{border_color_hex}"'
+    return (
+        '<w:tblPr><w:tblW w:w="0" w:type="auto"/><w:jc w:val="center"/>'
+        '<w:tblLayout w:type="fixed"/>'
+        '<w:tblLook w:val="04A0" w:firstRow="1" w:lastRow="0" w:firstColumn="1" '
+        'w:lastColumn="0" w:noHBand="0" w:noVBand="1"/>'
+        f'<w:tblBorders><w:top {border}/><w:left {border}/><w:bottom {border}/>'
+        f'<w:right {border}/><w:insideH {border}/><w:insideV {border}/></w:tblBorders>'
+        '</w:tblPr>'
     )
-    tc_pr.insert(0, tc_w)
 
 
-def _set_cell_vertical_alignment(cell, alignment: str) -> None:
-    """Set vertical alignment of a cell."""
-    tc = cell._tc
-    tc_pr = tc.get_or_add_tcPr()
+def _row_start_xml(height_twips: int) -> str:
+    """
+    Build the opening of a table row with an exact height.
 
-    existing_valign = tc_pr.find(qn('w:vAlign'))
-    if existing_valign is not None:
-        tc_pr.remove(existing_valign)
+    Args:
+        height_twips: Row height in twips (dxa).
 
-    v_align = parse_xml(
-        f'<w:vAlign xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" '
-        f'w:val="{alignment}"/>'
-    )
-    tc_pr.append(v_align)
+    Returns:
+        Serialized ``w:tr`` opening tag and ``w:trPr``.
+    """
+    return f'<w:tr><w:trPr><w:trHeight w:val="{height_twips}" w:hRule="exact"/></w:trPr>'
 
 
-def _set_cell_shading(cell, color_hex: str) -> None:
-    """Set the background shading color of a cell."""
-    tc = cell._tc
-    tc_pr = tc.get_or_add_tcPr()
-    shd = parse_xml(
-        f'<w:shd xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" '
-        f'w:val="clear" w:color="auto" w:fill="{color_hex}"/>'
-    )
-    tc_pr.append(shd)
-
-
-def _add_cell_text(cell, text: str, size=None, bold: bool = False,
-                   color=COLOR_BLACK, align=None) -> None:
-    """Add formatted text to a table cell."""
-    para = cell.paragraphs[0]
-    if align is not None:
-        para.alignment = align
-    run = para.add_run(text)
-    run.font.name = FONT_NAME
-    if size is not None:
-        run.font.size = size
-    if bold:
-        run.font.bold = bold
-    run.font.color.rgb = color
-
-
-def _set_table_borders(table, config: Config) -> None:
-    """Set table borders using config settings."""
-    border_color_hex = grayscale_to_hex(config.table.border.grayscale)
-    border_size = int(config.table.border.thickness * 8)
+def _tc_start_xml(width_dxa: int, bg_hex: str = None) -> str:
+    """
+    Build the opening of a vertically centered content cell.
 
-    tbl = table._tbl
-    tbl_pr = tbl.tblPr if tbl.tblPr is not None else parse_xml(
-        r'<w:tblPr xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"/>'
-    )
+    Args:
+        width_dxa: Cell width in dxa (twips).
+        bg_hex: Background fill color, or None for no shading.
 
-    tbl_borders = parse_xml(
-        f'''<w:tblBorders xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">
-            <w:top w:val="single" w:sz="{border_size}" w:color="{border_color_hex}"/>
-            <w:left w:val="single" w:sz="{border_size}" w:color="{border_color_hex}"/>
-            <w:bottom w:val="single" w:sz="{border_size}" w:color="{border_color_hex}"/>
-            <w:right w:val="single" w:sz="{border_size}" w:color="{border_color_hex}"/>
-            <w:insideH w:val="single" w:sz="{border_size}" w:color="{border_color_hex}"/>
-            <w:insideV w:val="single" w:sz="{border_size}" w:color="{border_color_hex}"/>
-        </w:tblBorders>'''
+    Returns:
+        Serialized ``w:tc`` opening tag and ``w:tcPr``.
+    """
+    return (
+        f'<w:tc><w:tcPr><w:tcW w:w="{width_dxa}" w:type="dxa"/><w:vAlign w:val="center"/>'
+        f'{_shading_xml(bg_hex) if bg_hex else ""}</w:tcPr>'
     )
 
-    tbl_pr.append(tbl_borders)
-    if tbl.tblPr is None:
-        tbl.insert(0, tbl_pr)
+
+def _shading_xml(bg_hex: str) -> str:
+    """Build a solid cell shading element for the given fill color."""
+    return f'<w:shd w:val="clear" w:color="auto" w:fill="{bg_hex}"/>'
@@ -5,22 +5,26 @@ Generates weekly overview tables using ISO 8601 week numbering.
 A year has 52 or 53 weeks depending on how the year boundaries fall.
 """
 
-from datetime import date, timedelta
+from copy import deepcopy
+from dataclasses import dataclass
+from datetime import date
+from functools import lru_cache
 from docx import Document
-from docx.shared import Cm, Pt, RGBColor, Twips
+from docx.shared import Cm, Twips
 from docx.enum.text import WD_ALIGN_PARAGRAPH
-from docx.enum.table import WD_TABLE_ALIGNMENT
-from docx.oxml.ns import nsdecls, qn
-from docx.oxml import parse_xml
+from docx.oxml.ns import qn
+from docx.oxml import OxmlElement
+from lxml.etree import SubElement
 
 from src.config import Config
 from src.document import (
     add_page_break, get_content_width_twips, compute_table_row_height,
     MINIMIZED_PARAGRAPH_HEIGHT_TWIPS, TWIPS_PER_CM, TWIPS_PER_PT,
     add_config_info_overlay, get_title_row_height_twips, get_header_row_height_twips,
-    grayscale_to_hex, grayscale_to_rgb
+    grayscale_to_hex
 )
 from src.utils.styles import FONT_NAME, COLOR_BLACK
+from src.utils.tables import append_table, get_body_sect_pr
 
 
 # Month names
@@ -29,10 +33,58 @@ MONTH_NAMES = [
     "July", "August", "September", "October", "November", "December"
 ]
 
+# Month column text indexed by [start_month][end_month] of a week, e.g.
+# "March" or "March / April"
+_WEEK_MONTH_STRINGS = [
+    [
+        MONTH_NAMES[start] if start == end else f"{MONTH_NAMES[start]} / {MONTH_NAMES[end]}"
+        for end in range(len(MONTH_NAMES))
+    ]
+    for start in range(len(MONTH_NAMES))
+]
+
 # Fixed column widths in cm (Week and Month have fixed content width)
 WEEK_COL_WIDTH_CM = 1.4   # For week numbers (1-53)
 MONTH_COL_WIDTH_CM = 4.0  # For month names
 
+DAYS_PER_WEEK = 7
+
+# Namespace-resolved tag and attribute names used by the table helpers
+_QN_TBL_W = qn('w:tblW')
+_QN_TBL_LAYOUT = qn('w:tblLayout')
+_QN_TBL_LOOK = qn('w:tblLook')
+_QN_TBL_GRID = qn('w:tblGrid')
+_QN_GRID_COL = qn('w:gridCol')
+_QN_TR = qn('w:tr')
+_QN_TR_PR = qn('w:trPr')
+_QN_TR_HEIGHT = qn('w:trHeight')
+_QN_TC = qn('w:tc')
+_QN_TC_PR = qn('w:tcPr')
+_QN_TCW = qn('w:tcW')
+_QN_GRID_SPAN = qn('w:gridSpan')
+_QN_VALIGN = qn('w:vAlign')
+_QN_SHD = qn('w:shd')
+_QN_W = qn('w:w')
+_QN_TYPE = qn('w:type')
+_QN_VAL = qn('w:val')
+_QN_HRULE = qn('w:hRule')
+_QN_COLOR = qn('w:color')
+_QN_FILL = qn('w:fill')
+_QN_P = qn('w:p')
+_QN_PPR = qn('w:pPr')
+_QN_JC = qn('w:jc')
+_QN_R = qn('w:r')
+_QN_RPR = qn('w:rPr')
+_QN_RFONTS = qn('w:rFonts')
+_QN_ASCII = qn('w:ascii')
+_QN_HANSI = qn('w:hAnsi')
+_QN_B = qn('w:b')
+_QN_SZ = qn('w:sz')
+_QN_T = qn('w:t')
+
+# Structured content text color
+_BLACK_HEX = str(COLOR_BLACK)
+
 
 def _calculate_column_widths(config: Config) -> tuple[int, int, int, int]:
     """
@@ -64,6 +116,86 @@ def _calculate_column_widths(config: Config) -> tuple[int, int, int, int]:
     return (week_col_twips, month_col_twips, notes1_twips, notes2_twips)
 
 
+@dataclass(frozen=True, slots=True)
+class WeekPlannerLayout:
+    """Table geometry and styling shared by every week planner page."""
+    week_col: int              # Column widths in twips
+    month_col: int
+    notes1_col: int
+    notes2_col: int
+    title_row_h: int           # Title row height in twips
+    header_row_h: int          # Header row height in twips
+    content_row_h: int         # Content row height in twips
+    title_bg_hex: str
+    title_font_hex: str
+    title_font_half_pts: int   # Title font size in half-points
+    header_bg_hex: str
+    header_font_hex: str
+    header_font_half_pts: int  # Header font size in half-points
+    first_week_bg_hex: str     # First week of month row shading
+    border_size: int           # Border width in eighths of a point
+    border_hex: str
+
+
+def _build_week_planner_layout(config: Config, rows_per_page: int) -> WeekPlannerLayout:
+    """
+    Compute the week planner table layout once for all pages.
+
+    Args:
+        config: Configuration with page, table and week planner settings.
+        rows_per_page: Number of content rows used for row height calculation
+                       (ensures consistent row heights across all pages).
+
+    Returns:
+        WeekPlannerLayout with widths, row heights and colors resolved.
+    """
+    # Calculate column widths dynamically based on content area
+    # 4 grid columns: Week, Month, Notes col1, Notes col2
+    week_col, month_col, notes1_col, notes2_col = _calculate_column_widths(config)
+
+    # Get row heights from config
+    title_row_height_twips = get_title_row_height_twips(config)
+    header_row_height_twips = get_header_row_height_twips(config)
+
+    # Compute content row height dynamically to fill exact vertical content area
+    # Formula: p_v = p_para + r_t + r_h + r_c * n
+    # Where p_para accounts for the minimized paragraph created by page break
+    content_row_height_twips = compute_table_row_height(
+        config=config,
+        num_content_rows=rows_per_page,
+        title_row_height_twips=title_row_height_twips,
+        header_row_height_twips=header_row_height_twips,
+        preceding_paragraph_height_twips=MINIMIZED_PARAGRAPH_HEIGHT_TWIPS
+    )
+
+    # Note: content_row.font_* settings are for optional supplementary text in
+    # normally-blank cells, not for structured data like week numbers and months.
+    # Structured data uses black text (COLOR_BLACK) directly.
+
+    # First week of month shading color from config
+    first_week_grayscale = config.raw.get('week_planner', {}).get('first_week_grayscale', 5)
+
+    # Colors and fonts are resolved here, so no per-page conversions remain
+    return WeekPlannerLayout(
+        week_col=week_col,
+        month_col=month_col,
+        notes1_col=notes1_col,
+        notes2_col=notes2_col,
+        title_row_h=title_row_height_twips,
+        header_row_h=header_row_height_twips,
+        content_row_h=content_row_height_twips,
+        title_bg_hex=grayscale_to_hex(config.table.title_row.background_grayscale),
+        title_font_hex=grayscale_to_hex(config.table.title_row.font_grayscale),
+        title_font_half_pts=int(config.table.title_row.font_size * 2),
+        header_bg_hex=grayscale_to_hex(config.table.header_row.background_grayscale),
+        header_font_hex=grayscale_to_hex(config.table.header_row.font_grayscale),
+        header_font_half_pts=int(config.table.header_row.font_size * 2),
+        first_week_bg_hex=grayscale_to_hex(first_week_grayscale),
+        border_size=int(config.table.border.thickness * 8),  # Convert to eighths of a point
+        border_hex=grayscale_to_hex(config.table.border.grayscale)
+    )
+
+
 def generate_week_planner(document: Document, config: Config) -> None:
     """
     Generate the Week Planner section.
@@ -82,6 +214,11 @@ def generate_week_planner(document: Document, config: Config) -> None:
     # Get all weeks for the year
     weeks = _get_year_weeks(year)
 
+    # Table layout is identical on every page, so compute it once
+    layout = _build_week_planner_layout(config, rows_per_page)
+
+    body_sect_pr = get_body_sect_pr(document)
+
     # Generate pages
     total_weeks = len(weeks)
     page_count = 0
@@ -100,8 +237,7 @@ def generate_week_planner(document: Document, config: Config) -> None:
         is_last_page = (end_idx == total_weeks)
         actual_rows = len(page_weeks) if is_last_page else rows_per_page
 
-        _create_week_planner_page(document, config, page_weeks, rows_per_page,
-                                   actual_rows, year)
+        _create_week_planner_page(body_sect_pr, layout, page_weeks, actual_rows, year)
 
         # Add overlay - first page is recto, then alternates
         is_recto = (page_count % 2 == 0)
@@ -132,412 +268,295 @@ def _get_year_weeks(year: int) -> list[tuple[int, str, bool]]:
         for each week. is_first_week_of_month is True if the week contains
         the 1st day of any month.
     """
-    weeks = []
-
     # Find the Monday of ISO week 1 for this year
     # ISO week 1 always contains January 4th
     jan4 = date(year, 1, 4)
-    week1_monday = jan4 - timedelta(days=jan4.weekday())
+    week1_monday_ordinal = jan4.toordinal() - jan4.weekday()
+
+    # December 28th always falls in the last ISO week of its year, so its
+    # week number is the year's week count. Weeks are then numbered
+    # consecutively, with no per-week isocalendar() lookup.
+    week_count = date(year, 12, 28).isocalendar()[1]
+
+    # The 1st of each month from December of the previous year to February
+    # of the next, as ordinals with their month numbers. These bracket every
+    # day of the ISO year, which runs from December 29th at the earliest to
+    # January 3rd at the latest, so months are found by integer comparison
+    # instead of creating a date for each Monday and Sunday.
+    month_firsts = [date(year - 1, 12, 1)]
+    month_firsts += [date(year, month, 1) for month in range(1, 13)]
+    month_firsts += [date(year + 1, 1, 1), date(year + 1, 2, 1)]
+    month_starts = [first.toordinal() for first in month_firsts]
+    month_nums = [first.month for first in month_firsts]
 
-    current_monday = week1_monday
-
-    # Iterate through all weeks of this ISO year
-    while True:
-        # Use Thursday to determine ISO year (Thursday is always in the
-        # correct ISO year for that week)
-        current_thursday = current_monday + timedelta(days=3)
-        iso_year, iso_week, _ = current_thursday.isocalendar()
-
-        # Stop when we've moved past this ISO year
-        if iso_year > year:
-            break
-
-        current_sunday = current_monday + timedelta(days=6)
-        month_str = _get_week_months(current_monday, current_sunday)
+    weeks = []
+    month_idx = 0  # Month containing the current Monday
+    for week_idx in range(week_count):
+        monday_ordinal = week1_monday_ordinal + week_idx * DAYS_PER_WEEK
+        sunday_ordinal = monday_ordinal + DAYS_PER_WEEK - 1
+        while month_starts[month_idx + 1] <= monday_ordinal:
+            month_idx += 1
+
+        # A week spans at most two months
+        spans_months = month_starts[month_idx + 1] <= sunday_ordinal
+        start_month = month_nums[month_idx]
+        end_month = month_nums[month_idx + 1] if spans_months else start_month
 
         # A week is the first week of a month if:
         # - Monday is the 1st of a month, OR
         # - The week spans two months (a new month starts during the week)
-        is_first_week = (current_monday.day == 1) or (current_monday.month != current_sunday.month)
-
-        weeks.append((iso_week, month_str, is_first_week))
+        is_first_week = (monday_ordinal == month_starts[month_idx]) or spans_months
 
-        current_monday += timedelta(days=7)
+        weeks.append((week_idx + 1, _WEEK_MONTH_STRINGS[start_month][end_month], is_first_week))
 
     return weeks
 
 
-def _get_week_months(monday: date, sunday: date) -> str:
-    """
-    Get the month string for a week.
-
-    If the week spans two months, returns "Month / Month".
-
-    Args:
-        monday: The Monday of the week.
-        sunday: The Sunday of the week.
-
-    Returns:
-        Month string (e.g., "January" or "March / April").
-    """
-    start_month = monday.month
-    end_month = sunday.month
-
-    if start_month == end_month:
-        return MONTH_NAMES[start_month]
-    else:
-        return f"{MONTH_NAMES[start_month]} / {MONTH_NAMES[end_month]}"
-
-
-def _create_week_planner_page(document: Document, config: Config,
+def _create_week_planner_page(body_sect_pr, layout: WeekPlannerLayout,
                                weeks: list[tuple[int, str, bool]],
-                               rows_per_page: int, actual_rows: int,
-                               year: int) -> None:
+                               actual_rows: int, year: int) -> None:
     """
     Create a single page of the week planner.
 
     Args:
-        document: The Word document.
-        config: Configuration settings.
+        body_sect_pr: The document body's final <w:sectPr> element.
+        layout: Table layout shared by all pages.
         weeks: List of (week_number, month_string, is_first_week_of_month)
                tuples for this page.
-        rows_per_page: Number of content rows used for row height calculation
-                       (ensures consistent row heights across all pages).
         actual_rows: Actual number of content rows to create in this table.
-                     For the last page, this may be less than rows_per_page.
+                     For the last page, this may be less than the rows per page.
         year: The planner year.
     """
-    # Create table: title row + header row + content rows
-    # 4 grid columns: Week, Month, Notes col1, Notes col2
-    total_rows = 2 + actual_rows  # title + header + content
-    table = document.add_table(rows=total_rows, cols=4)
-    table.alignment = WD_TABLE_ALIGNMENT.CENTER
-    table.autofit = False
-
-    # Set fixed table layout
-    _set_table_layout_fixed(table)
-
-    # Calculate column widths dynamically based on content area
-    week_col, month_col, notes1_col, notes2_col = _calculate_column_widths(config)
-
-    # Set table grid column widths
-    _set_table_grid(table, [week_col, month_col, notes1_col, notes2_col])
-
-    # Get row heights from config
-    title_row_height_twips = get_title_row_height_twips(config)
-    header_row_height_twips = get_header_row_height_twips(config)
-
-    # Compute content row height dynamically to fill exact vertical content area
-    # Formula: p_v = p_para + r_t + r_h + r_c * n
-    # Where p_para accounts for the minimized paragraph created by page break
-    content_row_height_twips = compute_table_row_height(
-        config=config,
-        num_content_rows=rows_per_page,
-        title_row_height_twips=title_row_height_twips,
-        header_row_height_twips=header_row_height_twips,
-        preceding_paragraph_height_twips=MINIMIZED_PARAGRAPH_HEIGHT_TWIPS
-    )
-
-    # Get colors from config
-    title_bg_hex = grayscale_to_hex(config.table.title_row.background_grayscale)
-    title_font_rgb = grayscale_to_rgb(config.table.title_row.font_grayscale)
-    title_font_color = RGBColor(*title_font_rgb)
-    title_font_size = Pt(config.table.title_row.font_size)
-
-    header_bg_hex = grayscale_to_hex(config.table.header_row.background_grayscale)
-    header_font_rgb = grayscale_to_rgb(config.table.header_row.font_grayscale)
-    header_font_color = RGBColor(*header_font_rgb)
-    header_font_size = Pt(config.table.header_row.font_size)
-
-    # Note: content_row.font_* settings are for optional supplementary text in
-    # normally-blank cells, not for structured data like week numbers and months.
-    # Structured data uses black text (RGBColor(0, 0, 0)) directly.
-
-    # First week of month shading color from config
-    first_week_grayscale = config.raw.get('week_planner', {}).get('first_week_grayscale', 5)
-    first_week_bg_hex = grayscale_to_hex(first_week_grayscale)
+    # Build the table as a detached element tree with its final widths, spans,
+    # shading and text, then insert it in one step. Creating it with
+    # document.add_table and restyling every row and cell through python-docx
+    # walked and rewrote the table many times over.
+    # Rows: title row + header row + content rows
+    tbl = OxmlElement('w:tbl')
+    _add_table_properties(tbl, layout)
+    _add_table_grid(tbl, [layout.week_col, layout.month_col, layout.notes1_col, layout.notes2_col])
+    notes_width = layout.notes1_col + layout.notes2_col
 
     # === TITLE ROW ===
-    title_row = table.rows[0]
-    _set_row_height(title_row, title_row_height_twips)
-
-    # Merge cells 0-2 for "Week Planner" (gridSpan=3)
-    title_cell = title_row.cells[0]
-    title_cell.merge(title_row.cells[2])
+    title_tr = _add_row(tbl, layout.title_row_h)
 
-    # Set cell widths
-    _set_cell_width(title_row.cells[0], week_col + month_col + notes1_col)
-    _set_cell_width(title_row.cells[3], notes2_col)
-
-    # Title cell: "Week Planner" - config background, config font, bold, left aligned
-    _set_cell_shading(title_cell, title_bg_hex)
-    _set_cell_vertical_alignment(title_cell, "center")
-    _add_cell_text(title_cell, "Week Planner", size=title_font_size, bold=True,
-                   color=title_font_color, align=None)  # None = default LEFT
+    # Title cell: "Week Planner" spans columns 0-2 (gridSpan=3)
+    # Config background, config font, bold, left aligned
+    title_cell = _add_cell(title_tr, layout.week_col + layout.month_col + layout.notes1_col,
+                           layout.title_bg_hex, grid_span=3)
+    _add_cell_text(title_cell, "Week Planner", size_half_pts=layout.title_font_half_pts,
+                   bold=True, color_hex=layout.title_font_hex, align=None)  # None = default LEFT
 
     # Year cell - config background, config font, bold, right aligned
-    year_cell = title_row.cells[3]
-    _set_cell_shading(year_cell, title_bg_hex)
-    _set_cell_vertical_alignment(year_cell, "center")
-    _add_cell_text(year_cell, str(year), size=title_font_size, bold=True,
-                   color=title_font_color, align=WD_ALIGN_PARAGRAPH.RIGHT)
+    year_cell = _add_cell(title_tr, layout.notes2_col, layout.title_bg_hex)
+    _add_cell_text(year_cell, str(year), size_half_pts=layout.title_font_half_pts,
+                   bold=True, color_hex=layout.title_font_hex, align=WD_ALIGN_PARAGRAPH.RIGHT)
 
     # === HEADER ROW ===
-    header_row = table.rows[1]
-    _set_row_height(header_row, header_row_height_twips)
-
-    # Merge Notes columns (2-3) (gridSpan=2)
-    header_row.cells[2].merge(header_row.cells[3])
-
-    # Set cell widths and content
-    header_widths = [week_col, month_col, notes1_col + notes2_col]
-    headers = ["Week", "Month", "Notes"]
-
-    header_cells = [header_row.cells[0], header_row.cells[1], header_row.cells[2]]
-    for i, (header_text, width) in enumerate(zip(headers, header_widths)):
-        cell = header_cells[i]
-        _set_cell_width(cell, width)
-        _set_cell_shading(cell, header_bg_hex)
-        _set_cell_vertical_alignment(cell, "center")
-        _add_cell_text(cell, header_text, size=header_font_size, bold=True,
-                       color=header_font_color, align=None)  # None = default LEFT
+    header_tr = _add_row(tbl, layout.header_row_h)
+
+    # Notes spans columns 2-3 (gridSpan=2)
+    headers = [
+        ("Week", layout.week_col, 1),
+        ("Month", layout.month_col, 1),
+        ("Notes", notes_width, 2),
+    ]
+    for header_text, width, grid_span in headers:
+        cell = _add_cell(header_tr, width, layout.header_bg_hex, grid_span=grid_span)
+        _add_cell_text(cell, header_text, size_half_pts=layout.header_font_half_pts,
+                       bold=True, color_hex=layout.header_font_hex,
+                       align=None)  # None = default LEFT
 
     # === CONTENT ROWS ===
-    for row_idx in range(actual_rows):
-        row = table.rows[row_idx + 2]
-        _set_row_height(row, content_row_height_twips)
-
-        # Merge Notes columns (2-3) (gridSpan=2)
-        row.cells[2].merge(row.cells[3])
-
-        # Set cell widths
-        _set_cell_width(row.cells[0], week_col)
-        _set_cell_width(row.cells[1], month_col)
-        _set_cell_width(row.cells[2], notes1_col + notes2_col)
-
-        # Set vertical alignment for all cells
-        _set_cell_vertical_alignment(row.cells[0], "center")
-        _set_cell_vertical_alignment(row.cells[1], "center")
-        _set_cell_vertical_alignment(row.cells[2], "center")
-
-        # Populate row with week data
-        week_num, month_str, is_first_week = weeks[row_idx]
+    for week_num, month_str, is_first_week in weeks[:actual_rows]:
+        tr = _add_row(tbl, layout.content_row_h)
 
         # Apply shading to first week of month rows
-        if is_first_week:
-            _set_cell_shading(row.cells[0], first_week_bg_hex)
-            _set_cell_shading(row.cells[1], first_week_bg_hex)
-            _set_cell_shading(row.cells[2], first_week_bg_hex)
+        fill_hex = layout.first_week_bg_hex if is_first_week else None
 
         # Week number - structured data uses black text (not content_row font settings)
         # content_row.font_* is for supplementary text in normally-blank cells
-        _add_cell_text(row.cells[0], str(week_num), size=None,
-                      color=RGBColor(0, 0, 0), align=None)
+        week_cell = _add_cell(tr, layout.week_col, fill_hex)
+        _add_cell_plain_text(week_cell, str(week_num))
 
         # Month - structured data uses black text
-        _add_cell_text(row.cells[1], month_str, size=None,
-                      color=RGBColor(0, 0, 0), align=None)
+        month_cell = _add_cell(tr, layout.month_col, fill_hex)
+        _add_cell_plain_text(month_cell, month_str)
+
+        # Notes column (2-3) (gridSpan=2) left empty
+        _add_cell(tr, notes_width, fill_hex, grid_span=2)
 
-        # Notes column left empty
+    append_table(body_sect_pr, tbl)
 
-    # Apply borders
-    _set_table_borders(table, config)
 
+# Elements are created directly with lxml rather than by parsing an XML
+# string per element, since these helpers run for every planner cell.
 
-def _set_table_layout_fixed(table) -> None:
+def _add_table_properties(tbl, layout: WeekPlannerLayout) -> None:
     """
-    Set table layout to fixed.
+    Add the table properties: centered, fixed layout, bordered.
 
     Args:
-        table: The table to set layout on.
+        tbl: The w:tbl element.
+        layout: Table layout with border settings.
     """
-    tbl = table._tbl
-    tbl_pr = tbl.tblPr
-    if tbl_pr is None:
-        tbl_pr = parse_xml(
-            r'<w:tblPr xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"/>'
-        )
-        tbl.insert(0, tbl_pr)
-
-    tbl_layout = parse_xml(
-        '<w:tblLayout xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" '
-        'w:type="fixed"/>'
-    )
-    tbl_pr.append(tbl_layout)
+    tbl.append(deepcopy(_table_properties_template(layout.border_size, layout.border_hex)))
 
 
-def _set_table_grid(table, col_widths: list[int]) -> None:
+@lru_cache(maxsize=32)
+def _table_properties_template(border_size: int, color_hex: str):
     """
-    Set the table grid column widths.
+    Build the w:tblPr element for a border size and color.
+
+    Cached so every planner table copies one prebuilt element; callers must
+    deepcopy the result before inserting it.
 
     Args:
-        table: The table to set grid on.
-        col_widths: List of column widths in dxa (twips).
-    """
-    tbl = table._tbl
+        border_size: Border width in eighths of a point.
+        color_hex: Border color hex string.
 
-    # Remove existing grid if any
-    existing_grid = tbl.find(qn('w:tblGrid'))
-    if existing_grid is not None:
-        tbl.remove(existing_grid)
+    Returns:
+        The w:tblPr element.
+    """
+    tbl_pr = OxmlElement('w:tblPr')
+    SubElement(tbl_pr, _QN_TBL_W, {_QN_W: '0', _QN_TYPE: 'auto'})
+    SubElement(tbl_pr, _QN_JC, {_QN_VAL: 'center'})
+    SubElement(tbl_pr, _QN_TBL_LAYOUT, {_QN_TYPE: 'fixed'})
+    SubElement(tbl_pr, _QN_TBL_LOOK, {
+        _QN_VAL: '04A0', qn('w:firstRow'): '1', qn('w:lastRow'): '0',
+        qn('w:firstColumn'): '1', qn('w:lastColumn'): '0',
+        qn('w:noHBand'): '0', qn('w:noVBand'): '1'
+    })
+
+    border_attrs = {_QN_VAL: 'single', qn('w:sz'): str(border_size), _QN_COLOR: color_hex}
+    tbl_borders = SubElement(tbl_pr, qn('w:tblBorders'))
+    for edge in ('top', 'left', 'bottom', 'right', 'insideH', 'insideV'):
+        SubElement(tbl_borders, qn(f'w:{edge}'), border_attrs)
+    return tbl_pr
+
+
+def _add_table_grid(tbl, col_widths: list[int]) -> None:
+    """
+    Add the table grid column widths.
 
-    # Create new grid
-    grid_xml = '<w:tblGrid xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+    Args:
+        tbl: The w:tbl element.
+        col_widths: List of column widths in dxa (twips).
+    """
+    tbl_grid = SubElement(tbl, _QN_TBL_GRID)
     for width in col_widths:
-        grid_xml += f'<w:gridCol w:w="{width}"/>'
-    grid_xml += '</w:tblGrid>'
-
-    tbl_grid = parse_xml(grid_xml)
+        SubElement(tbl_grid, _QN_GRID_COL, {_QN_W: str(width)})
 
-    # Insert after tblPr
-    tbl_pr = tbl.tblPr
-    if tbl_pr is not None:
-        tbl_pr.addnext(tbl_grid)
-    else:
-        tbl.insert(0, tbl_grid)
 
-
-def _set_row_height(row, height_twips: int, exact: bool = True) -> None:
+def _add_row(tbl, height_twips: int, exact: bool = True):
     """
-    Set the row height in twips.
+    Append a row with the given height.
 
     Args:
-        row: The table row.
+        tbl: The w:tbl element.
         height_twips: Height in twips (dxa).
         exact: If True, row height is exactly the specified value (won't grow).
                If False, row height is at least the specified value (can grow).
-    """
-    tr = row._tr
-    tr_pr = tr.get_or_add_trPr()
 
-    # Remove existing height if any
-    existing_height = tr_pr.find(qn('w:trHeight'))
-    if existing_height is not None:
-        tr_pr.remove(existing_height)
-
-    h_rule = "exact" if exact else "atLeast"
-    tr_height = parse_xml(
-        f'<w:trHeight xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" '
-        f'w:val="{height_twips}" w:hRule="{h_rule}"/>'
-    )
-    tr_pr.append(tr_height)
-
-
-def _set_cell_width(cell, width_dxa: int) -> None:
-    """
-    Set cell width in dxa (twips).
-
-    Args:
-        cell: The table cell.
-        width_dxa: Width in dxa.
+    Returns:
+        The new w:tr element.
     """
-    tc = cell._tc
-    tc_pr = tc.get_or_add_tcPr()
-
-    # Remove existing width if any
-    existing_width = tc_pr.find(qn('w:tcW'))
-    if existing_width is not None:
-        tc_pr.remove(existing_width)
-
-    tc_w = parse_xml(
-        f'<w:tcW xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" '
-        f'w:w="{width_dxa}" w:type="dxa"/>'
-    )
-    tc_pr.insert(0, tc_w)
+    tr = SubElement(tbl, _QN_TR)
+    tr_pr = SubElement(tr, _QN_TR_PR)
+    h_rule = "exact" if exact else "atLeast"
+    SubElement(tr_pr, _QN_TR_HEIGHT, {_QN_VAL: str(height_twips), _QN_HRULE: h_rule})
+    return tr
 
 
-def _set_cell_vertical_alignment(cell, alignment: str) -> None:
+def _add_cell(tr, width_dxa: int, fill_hex: str = None, grid_span: int = 1):
     """
-    Set vertical alignment of a cell.
+    Append a vertically centered cell with an empty paragraph.
 
     Args:
-        cell: The table cell.
-        alignment: Alignment value ("top", "center", "bottom").
-    """
-    tc = cell._tc
-    tc_pr = tc.get_or_add_tcPr()
-
-    # Remove existing vAlign if any
-    existing_valign = tc_pr.find(qn('w:vAlign'))
-    if existing_valign is not None:
-        tc_pr.remove(existing_valign)
+        tr: The w:tr element.
+        width_dxa: Cell width in dxa.
+        fill_hex: Background hex color (None for no shading).
+        grid_span: Number of grid columns the cell spans.
 
-    v_align = parse_xml(
-        f'<w:vAlign xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" '
-        f'w:val="{alignment}"/>'
-    )
-    tc_pr.append(v_align)
-
-
-def _set_cell_shading(cell, color_hex: str) -> None:
-    """
-    Set the background shading color of a cell.
-
-    Args:
-        cell: The table cell.
-        color_hex: Hex color string (e.g., "000000" for black).
+    Returns:
+        The new w:tc element.
     """
-    tc = cell._tc
-    tc_pr = tc.get_or_add_tcPr()
-    shd = parse_xml(
-        f'<w:shd xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" '
-        f'w:val="clear" w:color="auto" w:fill="{color_hex}"/>'
-    )
-    tc_pr.append(shd)
-
-
-def _add_cell_text(cell, text: str, size=None, bold: bool = False,
-                   color=COLOR_BLACK, align=None) -> None:
+    tc = SubElement(tr, _QN_TC)
+    tc_pr = SubElement(tc, _QN_TC_PR)
+    SubElement(tc_pr, _QN_TCW, {_QN_W: str(width_dxa), _QN_TYPE: 'dxa'})
+    if grid_span > 1:
+        SubElement(tc_pr, _QN_GRID_SPAN, {_QN_VAL: str(grid_span)})
+    if fill_hex is not None:
+        SubElement(tc_pr, _QN_SHD, {_QN_VAL: 'clear', _QN_COLOR: 'auto', _QN_FILL: fill_hex})
+    SubElement(tc_pr, _QN_VALIGN, {_QN_VAL: 'center'})
+    SubElement(tc, _QN_P)
+    return tc
+
+
+def _add_cell_text(tc, text: str, size_half_pts: int = None, bold: bool = False,
+                   color_hex: str = _BLACK_HEX, align=None) -> None:
     """
     Add formatted text to a table cell.
 
     Args:
-        cell: The table cell.
+        tc: The w:tc element.
         text: The text to add.
-        size: Font size (None to inherit from document default).
+        size_half_pts: Font size in half-points (None to inherit from
+                       document default).
         bold: Whether to make the text bold.
-        color: Font color (RGBColor).
+        color_hex: Font color hex string.
         align: Paragraph alignment (None for default LEFT).
     """
-    para = cell.paragraphs[0]
+    # The run is built directly under the cell's (empty) paragraph, producing
+    # the same XML as add_run plus the Font setters without going through
+    # python-docx's paragraph, run and font proxies. Sizes and colors arrive
+    # already in their XML form, so no Pt/RGBColor values are involved.
+    p = tc.find(_QN_P)
     if align is not None:
-        para.alignment = align
-    run = para.add_run(text)
-    run.font.name = FONT_NAME
-    if size is not None:
-        run.font.size = size
+        p_pr = SubElement(p, _QN_PPR)
+        SubElement(p_pr, _QN_JC, {_QN_VAL: WD_ALIGN_PARAGRAPH.to_xml(align)})
+
+    run = SubElement(p, _QN_R)
+    r_pr = SubElement(run, _QN_RPR)
+    SubElement(r_pr, _QN_RFONTS, {_QN_ASCII: FONT_NAME, _QN_HANSI: FONT_NAME})
     if bold:
-        run.font.bold = bold
-    run.font.color.rgb = color
+        SubElement(r_pr, _QN_B)
+    SubElement(r_pr, _QN_COLOR, {_QN_VAL: color_hex})
+    if size_half_pts is not None:
+        SubElement(r_pr, _QN_SZ, {_QN_VAL: str(size_half_pts)})
+    SubElement(run, _QN_T).text = text
 
 
-def _set_table_borders(table, config: Config) -> None:
+def _plain_text_paragraph_template():
     """
-    Set table borders using config settings.
+    Build the paragraph used for structured content text.
 
-    Args:
-        table: The table to set borders on.
-        config: Configuration with border settings.
+    Returns:
+        A w:p holding one black, default-size run with empty text.
     """
-    border_color_hex = grayscale_to_hex(config.table.border.grayscale)
-    border_size = int(config.table.border.thickness * 8)  # Convert to eighths of a point
+    tc = OxmlElement('w:tc')
+    SubElement(tc, _QN_P)
+    _add_cell_text(tc, "", size_half_pts=None, color_hex=_BLACK_HEX, align=None)
+    return tc.find(_QN_P)
 
-    tbl = table._tbl
-    tbl_pr = tbl.tblPr if tbl.tblPr is not None else parse_xml(
-        r'<w:tblPr xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"/>'
-    )
 
-    tbl_borders = parse_xml(
-        f'''<w:tblBorders xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">
-            <w:top w:val="single" w:sz="{border_size}" w:color="{border_color_hex}"/>
-            <w:left w:val="single" w:sz="{border_size}" w:color="{border_color_hex}"/>
-            <w:bottom w:val="single" w:sz="{border_size}" w:color="{border_color_hex}"/>
-            <w:right w:val="single" w:sz="{border_size}" w:color="{border_color_hex}"/>
-            <w:insideH w:val="single" w:sz="{border_size}" w:color="{border_color_hex}"/>
-            <w:insideV w:val="single" w:sz="{border_size}" w:color="{border_color_hex}"/>
-        </w:tblBorders>'''
-    )
+# Week number and month cells all share the same run formatting, so their
+# paragraph is built once and copied with only the text changed
+_PLAIN_TEXT_P = _plain_text_paragraph_template()
+_PLAIN_TEXT_T_PATH = f'{_QN_R}/{_QN_T}'
+
+
+def _add_cell_plain_text(tc, text: str) -> None:
+    """
+    Add black text in the inherited size to a table cell.
 
-    tbl_pr.append(tbl_borders)
-    if tbl.tblPr is None:
-        tbl.insert(0, tbl_pr)
+    Specialization of _add_cell_text for the content rows' week number and
+    month cells.
+
+    Args:
+        tc: The w:tc element (with its empty paragraph).
+        text: The text to add.
+    """
+    p = deepcopy(_PLAIN_TEXT_P)
+    p.find(_PLAIN_TEXT_T_PATH).text = text
+    tc.replace(tc.find(_QN_P), p)
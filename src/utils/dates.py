@@ -0,0 +1,14 @@
+"""
+Date label helpers for Year Planner document.
+
+Provides lookup tables shared by sections that print day labels.
+"""
+
+
+# Ordinal suffixes indexed by day of month (index 0 unused)
+ORDINAL_SUFFIXES = (
+    "th", "st", "nd", "rd", "th", "th", "th", "th", "th", "th",
+    "th", "th", "th", "th", "th", "th", "th", "th", "th", "th",
+    "th", "st", "nd", "rd", "th", "th", "th", "th", "th", "th",
+    "th", "st"
+)
@@ -4,7 +4,13 @@ Grid image generation for graph paper.
 Creates grid images using Pillow for insertion into Word documents.
 """
 
-from PIL import Image, ImageDraw
+from PIL import Image
+
+# Outer border thickness in pixels
+BORDER_WIDTH_PX = 2
+
+# Grayscale value of the white background
+WHITE = 255
 
 
 def generate_grid_image(
@@ -22,6 +28,10 @@ def generate_grid_image(
     Creates a white background image with evenly spaced grid lines and
     a distinct outer border.
 
+    The image has only three distinct scanlines (plain, horizontal grid line
+    and border), so they are built once as byte strings and stacked, rather
+    than drawing every grid line separately.
+
     Args:
         width_px: Image width in pixels.
         height_px: Image height in pixels.
@@ -31,51 +41,39 @@ def generate_grid_image(
         border_color_percent: Outer border color (0=white, 100=black).
         output_path: File path to save the PNG image.
     """
-    # Convert grayscale percentages to RGB values (0% = white, 100% = black)
+    # Convert grayscale percentages to gray levels (0% = white, 100% = black)
     grid_gray = int(255 * (1 - grid_color_percent / 100))
     border_gray = int(255 * (1 - border_color_percent / 100))
 
-    grid_color = (grid_gray, grid_gray, grid_gray)
-    border_color = (border_gray, border_gray, border_gray)
-
-    # Create white background image
-    image = Image.new('RGB', (width_px, height_px), 'white')
-    draw = ImageDraw.Draw(image)
-
     # Calculate cell dimensions
     cell_width = width_px / columns
     cell_height = height_px / rows
 
-    # Draw interior vertical grid lines (1px)
+    # Left and right border columns (2px for definition)
+    border_cols = (*range(BORDER_WIDTH_PX), *range(width_px - BORDER_WIDTH_PX, width_px))
+
+    # Plain scanline: white, crossed by the interior vertical grid lines (1px)
+    plain_row = bytearray([WHITE]) * width_px
     for i in range(1, columns):
-        x = int(i * cell_width)
-        draw.line([(x, 0), (x, height_px - 1)], fill=grid_color, width=1)
+        plain_row[int(i * cell_width)] = grid_gray
+    for x in border_cols:
+        plain_row[x] = border_gray
+
+    # Scanline on an interior horizontal grid line (1px)
+    grid_row = bytearray([grid_gray]) * width_px
+    for x in border_cols:
+        grid_row[x] = border_gray
 
-    # Draw interior horizontal grid lines (1px)
+    # Top and bottom border scanlines (2px for definition)
+    border_row = bytes([border_gray]) * width_px
+
+    scanlines = [bytes(plain_row)] * height_px
     for i in range(1, rows):
-        y = int(i * cell_height)
-        draw.line([(0, y), (width_px - 1, y)], fill=grid_color, width=1)
-
-    # Draw outer border (2px for definition)
-    # Top border
-    draw.line([(0, 0), (width_px - 1, 0)], fill=border_color, width=2)
-    draw.line([(0, 1), (width_px - 1, 1)], fill=border_color, width=1)
-
-    # Bottom border
-    draw.line([(0, height_px - 1), (width_px - 1, height_px - 1)],
-              fill=border_color, width=2)
-    draw.line([(0, height_px - 2), (width_px - 1, height_px - 2)],
-              fill=border_color, width=1)
-
-    # Left border
-    draw.line([(0, 0), (0, height_px - 1)], fill=border_color, width=2)
-    draw.line([(1, 0), (1, height_px - 1)], fill=border_color, width=1)
-
-    # Right border
-    draw.line([(width_px - 1, 0), (width_px - 1, height_px - 1)],
-              fill=border_color, width=2)
-    draw.line([(width_px - 2, 0), (width_px - 2, height_px - 1)],
-              fill=border_color, width=1)
+        scanlines[int(i * cell_height)] = bytes(grid_row)
+    for y in (*range(BORDER_WIDTH_PX), *range(height_px - BORDER_WIDTH_PX, height_px)):
+        scanlines[y] = border_row
+
+    image = Image.frombytes('L', (width_px, height_px), b''.join(scanlines))
 
     # Save as PNG
-    image.save(output_path, 'PNG')
+    image.convert('RGB').save(output_path, 'PNG')
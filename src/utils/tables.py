@@ -4,16 +4,67 @@ Table creation utilities for Year Planner document.
 Provides helpers for creating and styling Word tables.
 """
 
+from copy import deepcopy
+from functools import lru_cache
+
 from docx import Document
-from docx.table import Table, _Cell
+from docx.table import Table
 from docx.shared import Cm, Pt, RGBColor
-from docx.oxml.ns import nsdecls
+from docx.oxml.ns import nsdecls, qn
 from docx.oxml import parse_xml
 from docx.enum.table import WD_TABLE_ALIGNMENT
+from lxml.builder import ElementMaker
 
 from src.config import TableConfig
 
 
+# WordprocessingML element factory: builds border elements directly as lxml
+# trees instead of parsing an XML string per table
+_W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+_W = ElementMaker(namespace=_W_NS, nsmap={'w': _W_NS})
+
+# Table border edges, in schema order
+_BORDER_EDGES = ('top', 'left', 'bottom', 'right', 'insideH', 'insideV')
+
+
+def _tbl_borders(border_attrs: dict):
+    """
+    Build a ``w:tblBorders`` element with the same attributes on every edge.
+
+    Args:
+        border_attrs: Qualified attribute names and values for each edge.
+
+    Returns:
+        The ``w:tblBorders`` element.
+    """
+    return _W.tblBorders(*(getattr(_W, edge)(border_attrs) for edge in _BORDER_EDGES))
+
+
+@lru_cache(maxsize=32)
+def _single_borders(border_size: int, color_hex: str):
+    """
+    Build (once per size and color) a single-line ``w:tblBorders`` element.
+
+    Callers must deepcopy the result before inserting it into a table.
+
+    Args:
+        border_size: Border width in eighths of a point.
+        color_hex: Border color hex string.
+
+    Returns:
+        The cached ``w:tblBorders`` element.
+    """
+    return _tbl_borders({
+        qn('w:val'): 'single',
+        qn('w:sz'): str(border_size),
+        qn('w:color'): color_hex
+    })
+
+
+# Borderless template, copied by remove_table_borders
+_NIL_BORDERS = _tbl_borders({qn('w:val'): 'nil'})
+
+
 def create_table(document: Document, rows: int, cols: int,
                  width: float) -> Table:
     """
@@ -40,103 +91,83 @@ def create_table(document: Document, rows: int, cols: int,
     return table
 
 
-def set_table_borders(table: Table, config: TableConfig) -> None:
+def get_body_sect_pr(document: Document):
     """
-    Apply border styling to a table.
+    Get the document body's final ``<w:sectPr>`` element.
+
+    Body content is appended by inserting it just before this element.
+    Finding it scans the body's children, as does every python-docx
+    ``_insert_tbl`` call, and the body grows with each page. Sections that
+    add many tables look it up once and pass it to ``append_table`` or
+    ``append_table_xml``.
 
     Args:
-        table: The table to style.
-        config: Table configuration with border settings.
-    """
-    # Calculate grayscale color value (0=white, 100=black)
-    gray_value = int(255 * (1 - config.border.grayscale / 100))
-    color_hex = f"{gray_value:02X}{gray_value:02X}{gray_value:02X}"
+        document: The Word document.
 
-    # Border size in eighths of a point
-    border_size = int(config.border.thickness * 8)
+    Returns:
+        The body-level ``w:sectPr`` element.
+    """
+    return document.element.body.sectPr
 
-    tbl = table._tbl
-    tbl_pr = tbl.tblPr if tbl.tblPr is not None else parse_xml(
-        r'<w:tblPr xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"/>'
-    )
 
-    tbl_borders = parse_xml(
-        f'''<w:tblBorders xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">
-            <w:top w:val="single" w:sz="{border_size}" w:color="{color_hex}"/>
-            <w:left w:val="single" w:sz="{border_size}" w:color="{color_hex}"/>
-            <w:bottom w:val="single" w:sz="{border_size}" w:color="{color_hex}"/>
-            <w:right w:val="single" w:sz="{border_size}" w:color="{color_hex}"/>
-            <w:insideH w:val="single" w:sz="{border_size}" w:color="{color_hex}"/>
-            <w:insideV w:val="single" w:sz="{border_size}" w:color="{color_hex}"/>
-        </w:tblBorders>'''
-    )
+def append_table(body_sect_pr, tbl) -> None:
+    """
+    Append a table element to the document body.
 
-    tbl_pr.append(tbl_borders)
-    if tbl.tblPr is None:
-        tbl.insert(0, tbl_pr)
+    Args:
+        body_sect_pr: The body's final ``<w:sectPr>`` from get_body_sect_pr.
+        tbl: Detached ``<w:tbl>`` element.
+    """
+    body_sect_pr.addprevious(tbl)
 
 
-def remove_table_borders(table: Table) -> None:
+def append_table_xml(document: Document, table_xml: str, body_sect_pr=None) -> Table:
     """
-    Remove all borders from a table.
+    Parse a complete table XML fragment and append it to the document body.
 
-    Args:
-        table: The table to remove borders from.
-    """
-    tbl = table._tbl
-    tbl_pr = tbl.tblPr if tbl.tblPr is not None else parse_xml(
-        r'<w:tblPr xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"/>'
-    )
+    Lets callers build a whole ``<w:tbl>`` in one string and parse it once,
+    instead of creating the table through python-docx and styling it
+    cell by cell.
 
-    tbl_borders = parse_xml(
-        '''<w:tblBorders xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">
-            <w:top w:val="nil"/>
-            <w:left w:val="nil"/>
-            <w:bottom w:val="nil"/>
-            <w:right w:val="nil"/>
-            <w:insideH w:val="nil"/>
-            <w:insideV w:val="nil"/>
-        </w:tblBorders>'''
-    )
+    Args:
+        document: The Word document.
+        table_xml: Serialized ``<w:tbl>`` element (must declare the w namespace).
+        body_sect_pr: The body's final ``<w:sectPr>`` from get_body_sect_pr
+                      (looked up here if None).
 
-    tbl_pr.append(tbl_borders)
-    if tbl.tblPr is None:
-        tbl.insert(0, tbl_pr)
+    Returns:
+        Table wrapper around the appended element.
+    """
+    if body_sect_pr is None:
+        body_sect_pr = get_body_sect_pr(document)
+    tbl = parse_xml(table_xml)
+    append_table(body_sect_pr, tbl)
+    return Table(tbl, document._body)
 
 
-def set_cell_vertical_alignment(cell: _Cell, alignment: str = "center") -> None:
+def set_table_borders(table: Table, config: TableConfig) -> None:
     """
-    Set vertical alignment of a table cell.
+    Apply border styling to a table.
 
     Args:
-        cell: The cell to align.
-        alignment: Vertical alignment ('top', 'center', 'bottom').
+        table: The table to style.
+        config: Table configuration with border settings.
     """
-    tc = cell._tc
-    tc_pr = tc.get_or_add_tcPr()
-    val_map = {"top": "top", "center": "center", "bottom": "bottom"}
-    v_align = parse_xml(
-        f'<w:vAlign xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" w:val="{val_map.get(alignment, "center")}"/>'
-    )
-    tc_pr.append(v_align)
+    # Calculate grayscale color value (0=white, 100=black)
+    gray_value = int(255 * (1 - config.border.grayscale / 100))
+    color_hex = f"{gray_value:02X}{gray_value:02X}{gray_value:02X}"
+
+    # Border size in eighths of a point
+    border_size = int(config.border.thickness * 8)
 
+    table._tbl.tblPr.append(deepcopy(_single_borders(border_size, color_hex)))
 
-def set_cell_shading(cell: _Cell, grayscale: int) -> None:
+
+def remove_table_borders(table: Table) -> None:
     """
-    Set the background shading of a table cell using grayscale value.
+    Remove all borders from a table.
 
     Args:
-        cell: The cell to shade.
-        grayscale: Grayscale percentage (0=white, 100=black).
+        table: The table to remove borders from.
     """
-    # Convert grayscale percentage to hex color
-    gray_value = int(255 * (1 - grayscale / 100))
-    color_hex = f"{gray_value:02X}{gray_value:02X}{gray_value:02X}"
-
-    tc = cell._tc
-    tc_pr = tc.get_or_add_tcPr()
-    shd = parse_xml(
-        f'<w:shd xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" '
-        f'w:val="clear" w:color="auto" w:fill="{color_hex}"/>'
-    )
-    tc_pr.append(shd)
+    table._tbl.tblPr.append(deepcopy(_NIL_BORDERS))
@@ -0,0 +1,70 @@
+"""
+Tests for the Table of Contents section generator.
+"""
+
+import re
+from datetime import date, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from src.sections.toc import (
+    _build_toc_entries, _get_first_weeks_of_months, _get_week_count
+)
+
+
+# 2024-2027 per the multi-year guidelines, plus years that start in the
+# previous year's week 53 (2021) and week 52 (2022)
+YEARS = [2021, 2022, 2024, 2025, 2026, 2027]
+
+# Daily spread labels, e.g. "Week 1, January 1st, Thursday"
+_DAY_LABEL = re.compile(r"Week (\d+), \w+ \d+\w\w, \w+")
+
+
+@pytest.fixture
+def make_config():
+    """Build the minimal config _build_toc_entries reads, with default sections."""
+    def make(year: int):
+        return SimpleNamespace(document=SimpleNamespace(year=year), raw={})
+    return make
+
+
+@pytest.mark.parametrize("year", YEARS)
+def test_build_toc_entries_iso_weeks_match_isocalendar(make_config, year):
+    entries = _build_toc_entries(make_config(year))
+    day_weeks = [int(match.group(1)) for label in entries.labels
+                 if (match := _DAY_LABEL.fullmatch(label))]
+
+    first_day = date(year, 1, 1)
+    num_days = (date(year + 1, 1, 1) - first_day).days
+    expected = [(first_day + timedelta(days=offset)).isocalendar()[1]
+                for offset in range(num_days)]
+    assert day_weeks == expected
+
+
+@pytest.mark.parametrize("year", YEARS)
+def test_get_week_count_matches_isocalendar(year):
+    # December 28th always falls in the last ISO week of its year
+    assert _get_week_count(year) == date(year, 12, 28).isocalendar()[1]
+
+
+@pytest.mark.parametrize("year", YEARS)
+def test_get_first_weeks_of_months_mask_bits(year):
+    first_weeks = {date(year, month, 1).isocalendar()[1] for month in range(1, 13)}
+    mask = _get_first_weeks_of_months(year)
+
+    for week in range(54):
+        assert bool(mask & (1 << week)) == (week in first_weeks)
+    assert mask >> 54 == 0
+
+
+def test_get_first_weeks_of_months_page_range():
+    # 2026: March 1st is a Sunday (week 9), April 1st a Wednesday (week 14)
+    mask = _get_first_weeks_of_months(2026)
+
+    def page_mask(start_week: int, end_week: int) -> int:
+        return (1 << (end_week + 1)) - (1 << start_week)
+
+    assert mask & page_mask(9, 9)
+    assert not mask & page_mask(10, 13)
+    assert mask & page_mask(10, 14)
@@ -0,0 +1,56 @@
+"""
+Tests for the Week Planner section generator.
+"""
+
+from datetime import date, timedelta
+
+import pytest
+
+from src.sections.week_planner import MONTH_NAMES, _get_year_weeks
+
+
+# 2024-2027 per the multi-year guidelines, plus 2020 (53 weeks) and
+# 2021 (January 1st in the previous year's week 53)
+YEARS = [2020, 2021, 2024, 2025, 2026, 2027]
+
+
+def _iso_weeks(year: int) -> list[tuple[int, str, bool]]:
+    """Build the expected week rows from date.isocalendar()."""
+    weeks = []
+    day = date(year - 1, 12, 29)  # Earliest possible start of ISO week 1
+    while day <= date(year + 1, 1, 3):  # Latest possible end of the last week
+        iso_year, iso_week, iso_weekday = day.isocalendar()
+        if iso_year == year and iso_weekday == 1:
+            sunday = day + timedelta(days=6)
+            if day.month == sunday.month:
+                month_str = MONTH_NAMES[day.month]
+            else:
+                month_str = f"{MONTH_NAMES[day.month]} / {MONTH_NAMES[sunday.month]}"
+            is_first_week = day.day == 1 or day.month != sunday.month
+            weeks.append((iso_week, month_str, is_first_week))
+        day += timedelta(days=1)
+    return weeks
+
+
+@pytest.mark.parametrize("year", YEARS)
+def test_get_year_weeks_matches_isocalendar(year):
+    assert _get_year_weeks(year) == _iso_weeks(year)
+
+
+@pytest.mark.parametrize("year", [2020, 2026])
+def test_get_year_weeks_53_week_year(year):
+    weeks = _get_year_weeks(year)
+    assert len(weeks) == 53
+    assert weeks[-1][0] == 53
+
+
+@pytest.mark.parametrize("year", [2021, 2024, 2025, 2027])
+def test_get_year_weeks_52_week_year(year):
+    weeks = _get_year_weeks(year)
+    assert len(weeks) == 52
+    assert weeks[-1][0] == 52
+
+
+def test_get_year_weeks_week_1_starts_in_previous_year():
+    # ISO week 1 of 2026 starts on Monday, December 29, 2025
+    assert _get_year_weeks(2026)[0] == (1, "December / January", True)